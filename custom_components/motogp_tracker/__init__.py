@@ -1,18 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import time
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.typing import ConfigType
 
+from .api import MotoGPApiClient
+from .archive import ResultsArchive
+from .circuit_assets import async_setup_circuit_assets
 from .const import (
+    ARCHIVE_QUERY_LIMIT,
+    ARCHIVE_QUERY_MAX,
+    ARCHIVE_SYNC_INTERVAL,
+    BASE_URL,
     COORD_CONFIG,
     COORD_EVENT,
     COORD_LIVE,
     COORD_STANDINGS,
     DOMAIN,
+    ENV_BASE_URL,
+    KEY_ARCHIVE,
+    KEY_CLIENT,
     KEY_COORDINATORS,
+    SESSION_TYPES_KEPT,
 )
 from .coordinator import (
     MotoGPConfigCoordinator,
@@ -20,32 +38,111 @@ from .coordinator import (
     MotoGPLiveTimingCoordinator,
     MotoGPStandingsCoordinator,
 )
+from .image_cache import MotoGPImageView
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = ["sensor"]
 
+SERVICES = (
+    "refresh_config",
+    "refresh_standings",
+    "refresh_event",
+    "refresh_live",
+    "get_rider_profile",
+    "get_rider_profiles",
+    "get_live_classification",
+    "get_standings",
+    "get_sessions",
+    "get_lap_history",
+    "sync_archive",
+    "query_archive",
+)
+
+SEASON_YEAR = vol.All(vol.Coerce(int), vol.Range(min=1949, max=2100))
+
+SYNC_ARCHIVE_SCHEMA = vol.Schema({
+    vol.Optional("season_year"): SEASON_YEAR,
+})
+
+QUERY_ARCHIVE_SCHEMA = vol.Schema({
+    vol.Optional("rider"):        vol.All(vol.Coerce(str), vol.Strip, vol.Length(min=1)),
+    vol.Optional("season_year"):  SEASON_YEAR,
+    vol.Optional("event"):        vol.All(cv.string, vol.Strip, vol.Length(min=1)),
+    vol.Optional("session_type"): vol.All(cv.string, vol.Upper, vol.In(sorted(SESSION_TYPES_KEPT))),
+    vol.Optional("limit", default=ARCHIVE_QUERY_LIMIT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=ARCHIVE_QUERY_MAX)
+    ),
+})
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data.setdefault(DOMAIN, {})
+    async_register_websocket_commands(hass)
+    hass.http.register_view(MotoGPImageView(hass))
+    await async_setup_circuit_assets(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
-    config_coord = MotoGPConfigCoordinator(hass)
-    await config_coord.async_config_entry_first_refresh()
+    base_url = os.environ.get(ENV_BASE_URL) or BASE_URL
+    client   = MotoGPApiClient(hass, base_url, entry)
+    if client.namespace:
+        _LOGGER.warning(
+            "[MotoGP] API remplacee par %s (%s), stockage separe (%s)",
+            base_url, ENV_BASE_URL, client.namespace,
+        )
+
+    archive = ResultsArchive(hass, client)
+    await client.images.async_load()
 
-    standings_coord = MotoGPStandingsCoordinator(hass, config_coord)
-    event_coord     = MotoGPEventCoordinator(hass, config_coord)
+    config_coord    = MotoGPConfigCoordinator(hass, client)
+    standings_coord = MotoGPStandingsCoordinator(hass, client, config_coord)
+    event_coord     = MotoGPEventCoordinator(hass, client, config_coord)
 
-    for coord, label in [(standings_coord, "standings"), (event_coord, "event")]:
+    restored = [
+        coord for coord in (config_coord, standings_coord, event_coord)
+        if await coord.async_restore_snapshot()
+    ]
+
+    started = time.monotonic()
+    if config_coord not in restored:
         try:
-            await coord.async_config_entry_first_refresh()
-        except Exception as err:
-            _LOGGER.warning("[MotoGP] Premier refresh %s échoué : %s", label, err)
+            await config_coord.async_config_entry_first_refresh()
+        except Exception:
+            await client.async_close()
+            raise
+    config_ms = (time.monotonic() - started) * 1000
+
+    cold = [
+        (coord, label)
+        for coord, label in [(standings_coord, "standings"), (event_coord, "event")]
+        if coord not in restored
+    ]
+    results = await asyncio.gather(
+        *(coord.async_config_entry_first_refresh() for coord, _ in cold),
+        return_exceptions=True,
+    )
+    for (_, label), result in zip(cold, results):
+        if isinstance(result, BaseException):
+            _LOGGER.warning("[MotoGP] Premier refresh %s échoué : %s", label, result)
+
+    _LOGGER.debug(
+        "[MotoGP] Amorçage : config=%.0f ms, standings+event=%.0f ms",
+        config_ms, (time.monotonic() - started) * 1000 - config_ms,
+    )
 
-    live_coord = MotoGPLiveTimingCoordinator(hass, event_coord)
+    if restored:
+        _LOGGER.info("[MotoGP] Démarrage à chaud (%d snapshots), rafraîchissement en arrière-plan", len(restored))
+        entry.async_create_background_task(
+            hass, _async_warm_refresh(restored), f"{DOMAIN}_warm_refresh"
+        )
+
+    live_coord = MotoGPLiveTimingCoordinator(hass, client, event_coord)
 
     hass.data[DOMAIN][entry.entry_id] = {
+        KEY_CLIENT:  client,
+        KEY_ARCHIVE: archive,
         KEY_COORDINATORS: {
             COORD_CONFIG:    config_coord,
             COORD_STANDINGS: standings_coord,
@@ -58,19 +155,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _register_services(hass, entry)
 
+    @callback
+    def _schedule_archive_sync(_now=None) -> None:
+        entry.async_create_background_task(
+            hass, _async_sync_archive(archive), f"{DOMAIN}_archive_sync"
+        )
+
+    _schedule_archive_sync()
+    entry.async_on_unload(
+        async_track_time_interval(hass, _schedule_archive_sync, ARCHIVE_SYNC_INTERVAL)
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     _LOGGER.info("[MotoGP] Intégration initialisée ✅")
     return True
 
+async def _async_warm_refresh(coords: list) -> None:
+    started = time.monotonic()
+    if coords and isinstance(coords[0], MotoGPConfigCoordinator):
+        await coords.pop(0).async_refresh()
+    config_ms = (time.monotonic() - started) * 1000
+    await asyncio.gather(*(coord.async_refresh() for coord in coords))
+    _LOGGER.debug(
+        "[MotoGP] Rafraîchissement à chaud : config=%.0f ms, standings+event=%.0f ms",
+        config_ms, (time.monotonic() - started) * 1000 - config_ms,
+    )
+
+async def _async_sync_archive(archive: ResultsArchive, season_year: int | None = None) -> dict:
+    try:
+        return await archive.async_sync(season_year)
+    except Exception as err:
+        _LOGGER.warning("[MotoGP Archive] Synchronisation interrompue : %s", err)
+        return {"error": str(err)}
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None) or {}
+        for coord in entry_data.get(KEY_COORDINATORS, {}).values():
+            await coord.async_shutdown()
+        if (archive := entry_data.get(KEY_ARCHIVE)) is not None:
+            await archive.async_close()
+        if (client := entry_data.get(KEY_CLIENT)) is not None:
+            await client.async_close()
         if not hass.data[DOMAIN]:
-            for svc in ("refresh_config", "refresh_standings", "refresh_event", "refresh_live", "get_rider_profile"):
+            for svc in SERVICES:
                 if hass.services.has_service(DOMAIN, svc):
                     hass.services.async_remove(DOMAIN, svc)
     return unload_ok
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
@@ -90,8 +226,9 @@ def _register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     async def refresh_event(call: ServiceCall) -> None:
         coords = _coords()
+        coords[COORD_EVENT].invalidate_index()
         await coords[COORD_EVENT].async_request_refresh()
-        if (coords[COORD_EVENT].data or {}).get("race_uuid"):
+        if (coords[COORD_EVENT].data or {}).get("sessions"):
             await coords[COORD_LIVE].async_request_refresh()
 
     async def refresh_live(call: ServiceCall) -> None:
@@ -108,9 +245,75 @@ def _register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
         return profile
 
+    async def get_rider_profiles(call: ServiceCall) -> ServiceResponse:
+        uuids = call.data.get("riders_api_uuids") or []
+        if isinstance(uuids, str):
+            uuids = [u.strip() for u in uuids.split(",") if u.strip()]
+        profiles = await _coords()[COORD_STANDINGS].async_get_rider_profiles(list(uuids))
+        return {"profiles": profiles}
+
+    async def get_live_classification(call: ServiceCall) -> ServiceResponse:
+        live = _coords()[COORD_LIVE]
+        if session_uuid := call.data.get("session_uuid", ""):
+            results = live.session_results(session_uuid)
+            if results is None:
+                return {"error": f"Aucun resultat en cache pour {session_uuid}"}
+            return dict(results)
+        return dict(live.as_jsonable())
+
+    async def get_standings(call: ServiceCall) -> ServiceResponse:
+        std  = _coords()[COORD_STANDINGS]
+        data = std.data or {}
+        return {
+            "season_year":  data.get("season_year"),
+            "riders":       std.view("riders"),
+            "teams":        std.view("teams"),
+            "last_fetched": std.last_fetched.isoformat() if std.last_fetched else None,
+            "last_changed": std.last_changed.isoformat() if std.last_changed else None,
+        }
+
+    async def get_sessions(call: ServiceCall) -> ServiceResponse:
+        ev   = _coords()[COORD_EVENT]
+        data = ev.data or {}
+        return {
+            "race_uuid":    data.get("race_uuid"),
+            "sessions":     ev.view("sessions"),
+            "last_fetched": ev.last_fetched.isoformat() if ev.last_fetched else None,
+            "last_changed": ev.last_changed.isoformat() if ev.last_changed else None,
+        }
+
+    async def sync_archive(call: ServiceCall) -> ServiceResponse:
+        archive = hass.data[DOMAIN][entry.entry_id][KEY_ARCHIVE]
+        return await _async_sync_archive(archive, call.data.get("season_year"))
+
+    async def query_archive(call: ServiceCall) -> ServiceResponse:
+        archive = hass.data[DOMAIN][entry.entry_id][KEY_ARCHIVE]
+        rows = await archive.async_query(
+            rider        = call.data.get("rider"),
+            season_year  = call.data.get("season_year"),
+            event        = call.data.get("event"),
+            session_type = call.data.get("session_type"),
+            limit        = call.data["limit"],
+        )
+        return {"count": len(rows), "results": rows}
+
+    async def get_lap_history(call: ServiceCall) -> ServiceResponse:
+        live = _coords()[COORD_LIVE]
+        return {
+            "session_uuid": live.tracked_session,
+            "riders":       live.lap_history.as_dict(str(call.data.get("number", "")) or None),
+        }
+
     hass.services.async_register(DOMAIN, "refresh_config",    refresh_config)
     hass.services.async_register(DOMAIN, "refresh_standings", refresh_standings)
     hass.services.async_register(DOMAIN, "refresh_event",     refresh_event)
     hass.services.async_register(DOMAIN, "refresh_live",      refresh_live)
     hass.services.async_register(DOMAIN, "get_rider_profile", get_rider_profile, supports_response=SupportsResponse.ONLY,)
+    hass.services.async_register(DOMAIN, "get_rider_profiles", get_rider_profiles, supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "get_live_classification", get_live_classification, supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "get_standings",     get_standings,     supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "get_sessions",      get_sessions,      supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "get_lap_history",   get_lap_history,   supports_response=SupportsResponse.ONLY)
+    hass.services.async_register(DOMAIN, "sync_archive",      sync_archive,      schema=SYNC_ARCHIVE_SCHEMA,  supports_response=SupportsResponse.OPTIONAL)
+    hass.services.async_register(DOMAIN, "query_archive",     query_archive,     schema=QUERY_ARCHIVE_SCHEMA, supports_response=SupportsResponse.ONLY)
     _LOGGER.debug("[MotoGP] Services enregistrés")
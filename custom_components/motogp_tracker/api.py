@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+
+from .const import (
+    API_DIGEST_MAX_ENTRIES,
+    API_DNS_CACHE_TTL,
+    API_KEEPALIVE_TIMEOUT,
+    API_LIMIT_PER_HOST,
+    API_MICROCACHE_WINDOW,
+    API_PARSE_OFFLOAD_BYTES,
+    API_PARSE_WORKERS,
+    BASE_URL,
+    STORAGE_KEY_HTTP_CACHE,
+)
+from .decode import decode
+from .http_cache import ResponseCache
+from .image_cache import ImageCache
+from .metrics import (
+    CACHE_MICRO,
+    CACHE_NOT_MODIFIED,
+    CACHE_SHARED,
+    CACHE_UNCHANGED,
+    Metrics,
+    endpoint_key,
+)
+from .resilience import (
+    BREAKER_CLOSED,
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    parse_retry_after,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+def _consume_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+class MotoGPApiClient:
+
+    def __init__(
+        self, hass: HomeAssistant, base_url: str = BASE_URL, entry: ConfigEntry | None = None
+    ) -> None:
+        self._hass = hass
+        self.base_url  = base_url.rstrip("/")
+        self.namespace = (
+            "" if self.base_url == BASE_URL.rstrip("/")
+            else hashlib.blake2b(self.base_url.encode(), digest_size=4).hexdigest()
+        )
+        self._session: aiohttp.ClientSession | None = None
+        self._cache = ResponseCache(hass, self.storage_key(STORAGE_KEY_HTTP_CACHE))
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._recent: dict[str, tuple[float, Any]] = {}
+        self._digests: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._bucket = TokenBucket()
+        self._pool: ThreadPoolExecutor | None = None
+        self.metrics = Metrics()
+        self.images  = ImageCache(hass, self._get_session, entry)
+
+    def storage_key(self, key: str) -> str:
+        return f"{key}.{self.namespace}" if self.namespace else key
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=API_LIMIT_PER_HOST,
+                ttl_dns_cache=API_DNS_CACHE_TTL,
+                keepalive_timeout=API_KEEPALIVE_TIMEOUT,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    "Accept":          "application/json",
+                    "Accept-Encoding": "gzip, deflate",
+                    "User-Agent":      SERVER_SOFTWARE,
+                },
+            )
+        return self._session
+
+    async def fetch(self, endpoint: str, timeout: int = 20) -> Any:
+        now = time.monotonic()
+        if (recent := self._recent.get(endpoint)) is not None and now - recent[0] < API_MICROCACHE_WINDOW:
+            _LOGGER.debug("[MotoGP API] Micro-cache %s", endpoint)
+            self.metrics.record_cache_hit(endpoint, CACHE_MICRO)
+            return recent[1]
+
+        if (inflight := self._inflight.get(endpoint)) is not None:
+            _LOGGER.debug("[MotoGP API] Requete partagee %s", endpoint)
+            self.metrics.record_cache_hit(endpoint, CACHE_SHARED)
+        else:
+            inflight = self._inflight[endpoint] = self._hass.loop.create_task(
+                self._fetch_shared(endpoint, timeout), name=f"motogp_fetch {endpoint}"
+            )
+            inflight.add_done_callback(_consume_exception)
+            inflight.add_done_callback(lambda _: self._inflight.pop(endpoint, None))
+        return await asyncio.shield(inflight)
+
+    async def _fetch_shared(self, endpoint: str, timeout: int) -> Any:
+        data = await self._request(endpoint, timeout)
+        self._remember(endpoint, data)
+        return data
+
+    def _remember(self, endpoint: str, data: Any) -> None:
+        now = time.monotonic()
+        for key in [k for k, (at, _) in self._recent.items() if now - at >= API_MICROCACHE_WINDOW]:
+            del self._recent[key]
+        self._recent[endpoint] = (now, data)
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        key = endpoint_key(endpoint)
+        if (breaker := self._breakers.get(key)) is None:
+            breaker = self._breakers[key] = CircuitBreaker(key)
+        return breaker
+
+    @property
+    def api_status(self) -> str:
+        return (
+            "degraded"
+            if any(b.state != BREAKER_CLOSED for b in self._breakers.values())
+            else "ok"
+        )
+
+    def breaker_states(self) -> dict[str, dict]:
+        return {key: b.as_dict() for key, b in self._breakers.items()}
+
+    def cache_stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+    async def _request(self, endpoint: str, timeout: int) -> Any:
+        breaker = self._breaker(endpoint)
+        try:
+            breaker.before_request()
+        except CircuitOpenError:
+            self.metrics.record_error(endpoint, "circuit_open")
+            raise
+        await self._bucket.acquire()
+        try:
+            data = await self._send(endpoint, timeout)
+        except asyncio.CancelledError:
+            breaker.abort_probe()
+            raise
+        except aiohttp.ClientResponseError as err:
+            if err.status in (429, 503):
+                breaker.record_failure(parse_retry_after((err.headers or {}).get("Retry-After")))
+            elif err.status >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            self.metrics.record_error(endpoint, type(err).__name__)
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        self.metrics.record_success(endpoint)
+        return data
+
+    async def _send(self, endpoint: str, timeout: int, revalidate: bool = True) -> Any:
+        await self._cache.async_load()
+
+        url     = f"{self.base_url}/{endpoint}"
+        headers = self._cache.validators(endpoint) if revalidate else {}
+        _LOGGER.debug("[MotoGP API] --> GET %s", url)
+        started = time.monotonic()
+        async with self._get_session().get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as resp:
+            if resp.status == 304:
+                self.metrics.record_response(endpoint, 304, time.monotonic() - started)
+                if (cached := self._cache.get(endpoint)) is not None:
+                    _LOGGER.debug("[MotoGP API] <-- 304 (cache) %s", url)
+                    self.metrics.record_cache_hit(endpoint, CACHE_NOT_MODIFIED)
+                    self._cache.touch(endpoint)
+                    return cached["data"]
+                if not revalidate:
+                    raise aiohttp.ClientResponseError(
+                        resp.request_info, resp.history, status=304,
+                        message="304 sans requete conditionnelle", headers=resp.headers,
+                    )
+                _LOGGER.debug("[MotoGP API] <-- 304 sans entree en cache, nouvel essai %s", url)
+                resp.release()
+                return await self._send(endpoint, timeout, revalidate=False)
+            if resp.status >= 400:
+                self.metrics.record_response(endpoint, resp.status, time.monotonic() - started)
+            if resp.status == 404:
+                _LOGGER.debug("[MotoGP API] <-- 404 (inactif) %s", url)
+                self._cache.discard(endpoint)
+                return None
+            resp.raise_for_status()
+            body = await resp.read()
+            self.metrics.record_response(endpoint, resp.status, time.monotonic() - started, len(body))
+            data = await self._decode(endpoint, body)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[MotoGP API] <-- %s (%d octets) JSON: %s", url, len(body), data)
+            self._cache.put(
+                endpoint, data, len(body),
+                resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+            )
+            return data
+
+    async def _decode(self, endpoint: str, body: bytes) -> Any:
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        known  = self._digests.get(endpoint)
+        if known is not None and known[0] == digest:
+            self._digests.move_to_end(endpoint)
+            _LOGGER.debug("[MotoGP API] Contenu inchange %s", endpoint)
+            self.metrics.record_cache_hit(endpoint, CACHE_UNCHANGED)
+            return known[1]
+
+        started   = time.monotonic()
+        offloaded = len(body) >= API_PARSE_OFFLOAD_BYTES
+        if offloaded:
+            _LOGGER.debug("[MotoGP API] Decodage de %s (%d octets) hors boucle", endpoint, len(body))
+            data = await asyncio.get_running_loop().run_in_executor(
+                self._parse_pool(), decode, endpoint, body
+            )
+        else:
+            data = decode(endpoint, body)
+        self.metrics.record_parse(endpoint, time.monotonic() - started, offloaded)
+        self._digests[endpoint] = (digest, data)
+        self._digests.move_to_end(endpoint)
+        while len(self._digests) > API_DIGEST_MAX_ENTRIES:
+            self._digests.popitem(last=False)
+        return data
+
+    def _parse_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=API_PARSE_WORKERS, thread_name_prefix="motogp_parse"
+            )
+        return self._pool
+
+    async def async_close(self) -> None:
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        await self._cache.async_flush()
+        await self.images.async_flush()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        _LOGGER.debug("[MotoGP API] Session HTTP fermee")
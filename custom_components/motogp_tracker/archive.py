@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from .api import MotoGPApiClient
+from .const import (
+    ARCHIVE_DB,
+    ARCHIVE_EVENT_CONCURRENCY,
+    ARCHIVE_QUERY_LIMIT,
+    ARCHIVE_SETTLE_DELAY,
+    ARCHIVE_SYNC_CONCURRENCY,
+    CATEGORY_NAME,
+    DOMAIN,
+    SESSION_TYPES_KEPT,
+)
+from .scheduler import parse_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    uuid      TEXT PRIMARY KEY,
+    year      INTEGER NOT NULL,
+    category  TEXT,
+    synced_at TEXT
+);
+CREATE TABLE IF NOT EXISTS events (
+    uuid         TEXT PRIMARY KEY,
+    season_uuid  TEXT NOT NULL REFERENCES seasons(uuid),
+    name         TEXT,
+    country_iso  TEXT,
+    circuit_name TEXT,
+    date_start   TEXT,
+    date_end     TEXT,
+    synced_at    TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    uuid       TEXT PRIMARY KEY,
+    event_uuid TEXT NOT NULL REFERENCES events(uuid),
+    type       TEXT,
+    number     INTEGER,
+    date       TEXT,
+    status     TEXT,
+    synced_at  TEXT
+);
+CREATE TABLE IF NOT EXISTS classifications (
+    session_uuid TEXT NOT NULL REFERENCES sessions(uuid),
+    position     INTEGER,
+    rider_uuid   TEXT,
+    rider_number TEXT,
+    rider_name   TEXT,
+    team         TEXT,
+    constructor  TEXT,
+    points       REAL,
+    time         TEXT,
+    gap          TEXT,
+    status       TEXT,
+    PRIMARY KEY (session_uuid, rider_number)
+);
+CREATE INDEX IF NOT EXISTS idx_events_season         ON events(season_uuid);
+CREATE INDEX IF NOT EXISTS idx_sessions_event        ON sessions(event_uuid);
+CREATE INDEX IF NOT EXISTS idx_classifications_rider ON classifications(rider_uuid);
+CREATE INDEX IF NOT EXISTS idx_classifications_num   ON classifications(rider_number);
+"""
+
+QUERY = """
+SELECT s.year AS season_year, e.name AS event, e.uuid AS event_uuid, e.date_start,
+       se.type AS session_type, se.uuid AS session_uuid, se.date AS session_date,
+       c.position, c.rider_number, c.rider_name, c.team, c.constructor,
+       c.points, c.time, c.gap, c.status
+FROM classifications c
+JOIN sessions se ON se.uuid = c.session_uuid
+JOIN events   e  ON e.uuid  = se.event_uuid
+JOIN seasons  s  ON s.uuid  = e.season_uuid
+"""
+
+def _classification_row(session_uuid: str, r: dict) -> tuple:
+    rider = r.get("rider") or {}
+    gap   = r.get("gap") or {}
+    return (
+        session_uuid,
+        r.get("position"),
+        rider.get("riders_api_uuid") or "",
+        str(rider.get("number", "")),
+        rider.get("full_name", ""),
+        (r.get("team") or {}).get("name", ""),
+        (r.get("constructor") or {}).get("name", ""),
+        r.get("points"),
+        r.get("time"),
+        gap.get("first") if isinstance(gap, dict) else gap,
+        r.get("status"),
+    )
+
+class ResultsArchive:
+
+    def __init__(self, hass: HomeAssistant, client: MotoGPApiClient) -> None:
+        self._hass   = hass
+        self._client = client
+        db, ext      = os.path.splitext(ARCHIVE_DB)
+        self._path   = hass.config.path(".storage", client.storage_key(db) + ext)
+        self._conn: sqlite3.Connection | None = None
+        self._lock   = threading.Lock()
+        self._closed = False
+        self._sync_task:   asyncio.Task | None = None
+        self._sync_season: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Archive fermee")
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._connect().execute(sql, params).fetchall()]
+
+    def _write(self, sql: str, rows: list[tuple]) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(sql, rows)
+
+    def _store_classification(self, session_uuid: str, classification: list, synced_at: str) -> int:
+        rows = [_classification_row(session_uuid, r) for r in classification]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO classifications VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                conn.execute("UPDATE sessions SET synced_at = ? WHERE uuid = ?", (synced_at, session_uuid))
+        return len(rows)
+
+    async def _async_query(self, sql: str, params: tuple = ()) -> list[dict[str, Any]]:
+        return await self._hass.async_add_executor_job(self._execute, sql, params)
+
+    async def _async_write(self, sql: str, rows: list[tuple]) -> None:
+        if rows:
+            await self._hass.async_add_executor_job(self._write, sql, rows)
+
+    def _close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def async_close(self) -> None:
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_task.cancel()
+        await self._hass.async_add_executor_job(self._close)
+
+    async def async_sync(self, season_year: int | None = None) -> dict[str, int]:
+        while (task := self._sync_task) is not None and not task.done():
+            if self._sync_season == season_year:
+                _LOGGER.debug("[MotoGP Archive] Synchronisation deja en cours, attente du resultat")
+                return await asyncio.shield(task)
+            _LOGGER.debug("[MotoGP Archive] Synchronisation %s en cours, attente", self._sync_season)
+            await asyncio.wait([task])
+
+        self._sync_season = season_year
+        self._sync_task   = self._hass.async_create_background_task(
+            self._async_run_sync(season_year), f"{DOMAIN}_archive_sync_{season_year or 'current'}"
+        )
+        return await asyncio.shield(self._sync_task)
+
+    async def _async_run_sync(self, season_year: int | None) -> dict[str, int]:
+        started = time.monotonic()
+        stats   = await self._async_sync(season_year)
+        _LOGGER.info(
+            "[MotoGP Archive] Synchronisation %s : %d evenements, %d sessions, %d lignes (%.1f s)",
+            season_year or "saison courante", stats["events"], stats["sessions"], stats["rows"],
+            time.monotonic() - started,
+        )
+        return stats
+
+    async def _async_sync(self, season_year: int | None) -> dict[str, int]:
+        stats = {"events": 0, "sessions": 0, "rows": 0}
+
+        seasons: list = await self._client.fetch("results/seasons") or []
+        season = next(
+            (
+                s for s in seasons
+                if (str(s.get("year")) == str(season_year) if season_year else s.get("current") is True)
+            ),
+            None,
+        )
+        if season is None:
+            _LOGGER.warning("[MotoGP Archive] Saison %s introuvable", season_year or "courante")
+            return stats
+        season_id = str(season["id"])
+
+        categories: list = await self._client.fetch(f"results/categories?seasonUuid={season_id}") or []
+        category = next((c for c in categories if c.get("name") == CATEGORY_NAME), None)
+        if category is None:
+            return stats
+        category_id = str(category["id"])
+
+        await self._async_write(
+            "INSERT INTO seasons (uuid, year, category) VALUES (?, ?, ?) "
+            "ON CONFLICT(uuid) DO UPDATE SET category = excluded.category",
+            [(season_id, int(season.get("year") or 0), category_id)],
+        )
+
+        events: list = await self._client.fetch(f"results/events?seasonUuid={season_id}") or []
+        now  = dt_util.utcnow()
+        past = [
+            e for e in events
+            if not e.get("test", False)
+            and (end := parse_utc(e.get("date_end"))) is not None and end + ARCHIVE_SETTLE_DELAY < now
+        ]
+        await self._async_write(
+            "INSERT INTO events (uuid, season_uuid, name, country_iso, circuit_name, date_start, date_end) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(uuid) DO NOTHING",
+            [
+                (
+                    str(e.get("id") or e.get("uuid") or ""), season_id, e.get("name", ""),
+                    ((e.get("country") or {}).get("iso") or "").lower(),
+                    (e.get("circuit") or {}).get("name", ""),
+                    e.get("date_start", ""), e.get("date_end", ""),
+                )
+                for e in past
+            ],
+        )
+
+        pending = await self._async_query(
+            "SELECT uuid FROM events WHERE season_uuid = ? AND synced_at IS NULL ORDER BY date_start",
+            (season_id,),
+        )
+        semaphore  = asyncio.Semaphore(ARCHIVE_SYNC_CONCURRENCY)
+        events_sem = asyncio.Semaphore(ARCHIVE_EVENT_CONCURRENCY)
+
+        async def _event(event_uuid: str) -> None:
+            async with events_sem:
+                synced = await self._async_sync_event(event_uuid, category_id, semaphore, stats)
+            if synced:
+                await self._async_write(
+                    "UPDATE events SET synced_at = ? WHERE uuid = ?",
+                    [(dt_util.utcnow().isoformat(), event_uuid)],
+                )
+                stats["events"] += 1
+
+        await asyncio.gather(*(_event(row["uuid"]) for row in pending))
+
+        await self._async_write(
+            "UPDATE seasons SET synced_at = ? WHERE uuid = ?",
+            [(dt_util.utcnow().isoformat(), season_id)],
+        )
+        return stats
+
+    async def _async_sync_event(
+        self, event_uuid: str, category_id: str, semaphore: asyncio.Semaphore, stats: dict[str, int]
+    ) -> bool:
+        try:
+            raw = await self._client.fetch(
+                f"results/sessions?eventUuid={event_uuid}&categoryUuid={category_id}"
+            )
+        except Exception as err:
+            _LOGGER.warning("[MotoGP Archive] Sessions inaccessibles (%s) : %s", event_uuid, err)
+            return False
+        if not raw or not isinstance(raw, list):
+            _LOGGER.debug("[MotoGP Archive] Aucune session pour %s, nouvel essai au prochain passage", event_uuid)
+            return False
+
+        sessions = [s for s in raw if (s.get("type") or "").upper() in SESSION_TYPES_KEPT]
+        await self._async_write(
+            "INSERT INTO sessions (uuid, event_uuid, type, number, date, status) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(uuid) DO UPDATE SET status = excluded.status",
+            [
+                (
+                    str(s.get("id")), event_uuid, (s.get("type") or "").upper(),
+                    s.get("number"), s.get("date", ""), (s.get("status") or "").upper(),
+                )
+                for s in sessions
+            ],
+        )
+
+        done = {
+            row["uuid"]
+            for row in await self._async_query(
+                "SELECT uuid FROM sessions WHERE event_uuid = ? AND synced_at IS NOT NULL", (event_uuid,)
+            )
+        }
+
+        async def _one(session_uuid: str) -> bool:
+            async with semaphore:
+                try:
+                    raw = await self._client.fetch(f"results/session/{session_uuid}/classification?test=false")
+                except Exception as err:
+                    _LOGGER.debug("[MotoGP Archive] Classement inaccessible (%s) : %s", session_uuid, err)
+                    return False
+            count = await self._hass.async_add_executor_job(
+                self._store_classification,
+                session_uuid,
+                (raw or {}).get("classification") or [],
+                dt_util.utcnow().isoformat(),
+            )
+            stats["sessions"] += 1
+            stats["rows"]     += count
+            return True
+
+        todo    = [str(s.get("id")) for s in sessions if str(s.get("id")) not in done]
+        results = await asyncio.gather(*(_one(uuid) for uuid in todo))
+        if not all(results):
+            return False
+
+        stored = await self._async_query(
+            "SELECT 1 FROM classifications c JOIN sessions s ON s.uuid = c.session_uuid "
+            "WHERE s.event_uuid = ? LIMIT 1",
+            (event_uuid,),
+        )
+        return bool(stored)
+
+    async def async_query(
+        self,
+        rider: str | None = None,
+        season_year: int | None = None,
+        event: str | None = None,
+        session_type: str | None = None,
+        limit: int = ARCHIVE_QUERY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        where:  list[str] = []
+        params: list[Any] = []
+        if rider and rider.isdigit():
+            where.append("c.rider_number = ?")
+            params.append(rider)
+        elif rider and len(rider) == 36 and rider.count("-") == 4:
+            where.append("c.rider_uuid = ?")
+            params.append(rider)
+        elif rider:
+            where.append("c.rider_name LIKE ?")
+            params.append(f"%{rider}%")
+        if season_year:
+            where.append("s.year = ?")
+            params.append(season_year)
+        if event:
+            where.append("(e.uuid = ? OR e.name LIKE ?)")
+            params += [event, f"%{event}%"]
+        if session_type:
+            where.append("se.type = ?")
+            params.append(session_type.upper())
+
+        sql = QUERY
+        if where:
+            sql += "WHERE " + " AND ".join(where) + "\n"
+        sql += "ORDER BY se.date DESC, c.position IS NULL, c.position LIMIT ?"
+        params.append(limit)
+        return await self._async_query(sql, tuple(params))
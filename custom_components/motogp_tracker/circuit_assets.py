@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CIRCUIT_ASSETS_DIR,
+    CIRCUIT_SLUGS,
+    CIRCUIT_SVG_URL,
+    DOMAIN,
+    IMMUTABLE_CACHE_CONTROL,
+    KEY_CIRCUITS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SOURCE_DIR = os.path.join(os.path.dirname(__file__), "circuits")
+SUFFIX     = "-info.svg"
+
+_COMMENT    = re.compile(rb"<!--.*?-->", re.S)
+_BETWEEN    = re.compile(rb">\s+<")
+_WHITESPACE = re.compile(rb"\s+")
+
+def minify_svg(body: bytes) -> bytes:
+    body = _COMMENT.sub(b"", body)
+    body = _BETWEEN.sub(b"><", body)
+    return _WHITESPACE.sub(b" ", body).strip()
+
+def build_circuit_assets(target: str) -> dict[str, str]:
+    os.makedirs(target, exist_ok=True)
+    expected = set(CIRCUIT_SLUGS.values())
+    assets: dict[str, str] = {}
+
+    for name in sorted(os.listdir(SOURCE_DIR)):
+        if not name.endswith(SUFFIX):
+            continue
+        slug = name[:-len(SUFFIX)]
+        with open(os.path.join(SOURCE_DIR, name), "rb") as fh:
+            body = fh.read()
+        if b"<svg" not in body:
+            _LOGGER.warning("[MotoGP Circuits] %s vide ou invalide, ignore", name)
+            continue
+        if slug not in expected:
+            _LOGGER.debug("[MotoGP Circuits] %s sans correspondance dans CIRCUIT_SLUGS", name)
+
+        body     = minify_svg(body)
+        filename = f"{slug}-info.{hashlib.sha256(body).hexdigest()[:12]}.svg"
+        path     = os.path.join(target, filename)
+        if not os.path.exists(path + ".gz"):
+            with open(path, "wb") as fh:
+                fh.write(body)
+            with open(path + ".gz", "wb") as fh:
+                fh.write(gzip.compress(body, compresslevel=9, mtime=0))
+        assets[slug] = filename
+
+    keep = set(assets.values()) | {f"{f}.gz" for f in assets.values()}
+    for name in os.listdir(target):
+        if name not in keep:
+            os.remove(os.path.join(target, name))
+
+    if missing := sorted(expected - assets.keys()):
+        _LOGGER.warning("[MotoGP Circuits] Trace manquant pour : %s", ", ".join(missing))
+    _LOGGER.debug("[MotoGP Circuits] %d traces prets dans %s", len(assets), target)
+    return assets
+
+async def async_setup_circuit_assets(hass: HomeAssistant) -> None:
+    target = hass.config.path(".storage", CIRCUIT_ASSETS_DIR)
+    assets = await hass.async_add_executor_job(build_circuit_assets, target)
+    hass.data[KEY_CIRCUITS] = assets
+    hass.http.register_view(MotoGPCircuitView(target, set(assets.values())))
+
+def circuit_svg_url(hass: HomeAssistant, slug: str) -> str:
+    filename = hass.data.get(KEY_CIRCUITS, {}).get(slug)
+    return CIRCUIT_SVG_URL.format(filename=filename) if filename else ""
+
+class MotoGPCircuitView(HomeAssistantView):
+
+    url           = CIRCUIT_SVG_URL.format(filename="{filename}")
+    name          = f"api:{DOMAIN}:circuit"
+    requires_auth = False
+
+    def __init__(self, directory: str, filenames: set[str]) -> None:
+        self._directory = directory
+        self._filenames = filenames
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        if filename not in self._filenames:
+            return web.Response(status=404)
+        return web.FileResponse(
+            os.path.join(self._directory, filename),
+            headers={"Cache-Control": IMMUTABLE_CACHE_CONTROL},
+        )
@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN
+from .const import (
+    CONF_ATTRIBUTE_MAX_ROWS,
+    CONF_RIDER_ENTITIES,
+    DEFAULT_ATTRIBUTE_MAX_ROWS,
+    DEFAULT_RIDER_ENTITIES,
+    DOMAIN,
+)
 
 class MotoGPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> MotoGPOptionsFlow:
+        return MotoGPOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         if user_input is not None:
             await self.async_set_unique_id("motogp_tracker_singleton")
@@ -20,3 +32,27 @@ class MotoGPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_import(self, user_input=None) -> FlowResult:
         return await self.async_step_user(user_input)
+
+class MotoGPOptionsFlow(config_entries.OptionsFlow):
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_ATTRIBUTE_MAX_ROWS,
+                    default=options.get(CONF_ATTRIBUTE_MAX_ROWS, DEFAULT_ATTRIBUTE_MAX_ROWS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+                vol.Optional(
+                    CONF_RIDER_ENTITIES,
+                    default=options.get(CONF_RIDER_ENTITIES, DEFAULT_RIDER_ENTITIES),
+                ): bool,
+            }),
+        )
@@ -2,27 +2,140 @@ from datetime import timedelta
 
 DOMAIN = "motogp_tracker"
 
-BASE_URL = "https://api.motogp.pulselive.com/motogp/v1"
+BASE_URL     = "https://api.motogp.pulselive.com/motogp/v1"
+ENV_BASE_URL = "MOTOGP_TRACKER_BASE_URL"
+
+API_LIMIT_PER_HOST     = 4
+API_DNS_CACHE_TTL      = 300
+API_KEEPALIVE_TIMEOUT  = 60
+API_MICROCACHE_WINDOW  = 2.0
+API_DIGEST_MAX_ENTRIES = 64
+API_PARSE_OFFLOAD_BYTES = 128 * 1024
+API_PARSE_WORKERS       = 2
+
+API_BREAKER_THRESHOLD = 3
+API_BACKOFF_BASE      = 30.0
+API_BACKOFF_MAX       = 1800.0
+API_RATE_PER_SECOND   = 2.0
+API_RATE_BURST        = 10.0
+
+METRICS_LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_SCAN_INTERVAL   = timedelta(minutes=1)
+METRICS_LOOP_LAG_WARN   = 0.1
 
 INTERVAL_CONFIG    = timedelta(hours=6)
 INTERVAL_STANDINGS = timedelta(hours=3)
-INTERVAL_EVENT     = timedelta(hours=1)
+INTERVAL_EVENT     = timedelta(hours=6)
 INTERVAL_LIVE      = timedelta(seconds=30)
 
+INTERVAL_LIVE_FAST    = timedelta(seconds=10)
+INTERVAL_LIVE_WARMUP  = timedelta(seconds=60)
+INTERVAL_LIVE_DORMANT = timedelta(hours=6)
+INTERVAL_LIVE_MIN     = timedelta(seconds=60)
+
+EVENT_BOUNDARY_DELAY = timedelta(minutes=2)
+
+LIVE_WARMUP   = timedelta(minutes=15)
+LIVE_COOLDOWN = timedelta(minutes=10)
+
+LIVE_PHASE_DORMANT  = "dormant"
+LIVE_PHASE_WARMUP   = "warmup"
+LIVE_PHASE_LIVE     = "live"
+LIVE_PHASE_COOLDOWN = "cooldown"
+
 TZ_PARIS = "Europe/Paris"
 
+STORAGE_VERSION   = 1
+STORAGE_KEY_INDEX = f"{DOMAIN}.season_index"
+STORAGE_KEY_HTTP_CACHE = f"{DOMAIN}.http_cache"
+STORAGE_KEY_SNAPSHOT   = DOMAIN + ".snapshot_{name}"
+STORAGE_KEY_PROFILES   = f"{DOMAIN}.rider_profiles"
+STORAGE_KEY_IMAGES     = f"{DOMAIN}.images"
+
+PROFILE_CACHE_MAX            = 64
+PROFILE_CACHE_TTL            = timedelta(days=7)
+PROFILE_CACHE_SAVE_DELAY     = 30
+PROFILE_PREFETCH_CONCURRENCY = 4
+
+SNAPSHOT_SAVE_DELAY = 10
+
+HTTP_CACHE_TTLS: dict[str, timedelta] = {
+    "results/seasons":    timedelta(days=30),
+    "results/categories": timedelta(days=30),
+    "results/standings":  timedelta(days=7),
+    "results/events":     timedelta(days=7),
+    "results/sessions":   timedelta(days=2),
+    "riders/":            timedelta(days=30),
+}
+HTTP_CACHE_MAX_BYTES   = 2 * 1024 * 1024
+HTTP_CACHE_MAX_ENTRIES = 128
+HTTP_CACHE_SAVE_DELAY  = 30
+
+IMAGE_CACHE_DIR         = f"{DOMAIN}_images"
+IMAGE_CACHE_MAX_BYTES   = 20 * 1024 * 1024
+IMAGE_CACHE_SAVE_DELAY  = 30
+IMAGE_MAX_BYTES         = 2 * 1024 * 1024
+IMAGE_FETCH_CONCURRENCY = 4
+IMAGE_RETRY_DELAY       = 600
+IMAGE_URL               = f"/api/{DOMAIN}/image/{{key}}"
+
+ARCHIVE_DB                = f"{DOMAIN}_archive.db"
+ARCHIVE_SYNC_CONCURRENCY  = 3
+ARCHIVE_EVENT_CONCURRENCY = 2
+ARCHIVE_SYNC_INTERVAL     = timedelta(hours=12)
+ARCHIVE_SETTLE_DELAY      = timedelta(days=1)
+ARCHIVE_QUERY_LIMIT       = 200
+ARCHIVE_QUERY_MAX         = 2000
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+INDEX_REVALIDATE = timedelta(days=1)
+INDEX_SAVE_DELAY = 10
+
+CONF_ATTRIBUTE_MAX_ROWS    = "attribute_max_rows"
+DEFAULT_ATTRIBUTE_MAX_ROWS = 0
+CONF_RIDER_ENTITIES        = "rider_entities"
+DEFAULT_RIDER_ENTITIES     = False
+
 KEY_COORDINATORS = "coordinators"
+KEY_CLIENT       = "client"
+KEY_CIRCUITS     = f"{DOMAIN}_circuits"
+KEY_ARCHIVE      = "archive"
 
 COORD_CONFIG    = "config"
 COORD_STANDINGS = "standings"
 COORD_EVENT     = "event"
 COORD_LIVE      = "live"
 
+CATEGORY_NAME = "MotoGP™"
+
 SESSION_TYPES_KEPT = {"FP", "PR", "Q", "SPR", "RAC"}
 
+SESSION_DURATIONS: dict[str, timedelta] = {
+    "FP":  timedelta(minutes=45),
+    "PR":  timedelta(minutes=60),
+    "Q":   timedelta(minutes=15),
+    "SPR": timedelta(minutes=40),
+    "RAC": timedelta(minutes=60),
+}
+SESSION_DURATION_DEFAULT = timedelta(minutes=60)
+
+LAP_HISTORY_WINDOW       = 5
+LAP_HISTORY_DEFAULT_LAPS = 30
+
+RETIRED_STATUSES = {"retired", "ret", "dnf", "out", "not classified", "nc"}
+
+EVENT_OVERTAKE       = f"{DOMAIN}_overtake"
+EVENT_LAP_COMPLETED  = f"{DOMAIN}_lap_completed"
+EVENT_FASTEST_LAP    = f"{DOMAIN}_fastest_lap"
+EVENT_RETIREMENT     = f"{DOMAIN}_retirement"
+EVENT_STATUS_CHANGE  = f"{DOMAIN}_status_change"
+EVENT_SESSION_STATUS = f"{DOMAIN}_session_status"
+
 LIVE_STATUSES = {"started", "on track", "formation lap", "warm up lap", "in progress", "live", "s"}
 
-CIRCUIT_SVG_PATH = "/local/motogp/circuits/{slug}-info.svg"
+CIRCUIT_SVG_URL    = f"/api/{DOMAIN}/circuit/{{filename}}"
+CIRCUIT_ASSETS_DIR = f"{DOMAIN}_circuits"
 
 CIRCUIT_SLUGS: dict[str, str] = {
 
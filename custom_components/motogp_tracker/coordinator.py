@@ -1,51 +1,61 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import Any
 
-import aiohttp
 import pytz
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 import homeassistant.util.dt as dt_util
 
+from .api import MotoGPApiClient
 from .const import (
-    BASE_URL,
-    CIRCUIT_SLUGS,
-    CIRCUIT_SVG_PATH,
+    CATEGORY_NAME,
     COORD_CONFIG,
     COORD_EVENT,
     COORD_LIVE,
     COORD_STANDINGS,
     DOMAIN,
+    EVENT_FASTEST_LAP,
+    EVENT_LAP_COMPLETED,
+    EVENT_OVERTAKE,
+    EVENT_RETIREMENT,
+    EVENT_SESSION_STATUS,
+    EVENT_STATUS_CHANGE,
     INTERVAL_CONFIG,
+    INDEX_SAVE_DELAY,
     INTERVAL_EVENT,
     INTERVAL_LIVE,
     INTERVAL_STANDINGS,
+    LIVE_PHASE_DORMANT,
     LIVE_STATUSES,
+    PROFILE_PREFETCH_CONCURRENCY,
     SESSION_TYPES_KEPT,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY_INDEX,
+    STORAGE_KEY_PROFILES,
+    STORAGE_KEY_SNAPSHOT,
+    STORAGE_VERSION,
     TZ_PARIS,
 )
+from .circuit_assets import circuit_svg_url
+from .season_index import SeasonIndex
+from .lap_history import LapHistory
+from .live_delta import LiveDelta, LiveDeltaEngine
+from .metrics import loop_guard
+from .models import LiveRow, RiderStanding, SessionRow, TeamStanding
+from .profile_cache import ProfileCache, project_profile
+from .resilience import CircuitOpenError
+from .scheduler import LiveSchedule, live_schedule, next_boundary
 
 _LOGGER = logging.getLogger(__name__)
 
-async def _fetch(endpoint: str, timeout: int = 20) -> Any:
-    url = f"{BASE_URL}/{endpoint}"
-    _LOGGER.debug("[MotoGP API] --> GET %s", url)
-    async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(total=timeout)
-    ) as session:
-        async with session.get(url) as resp:
-            if resp.status == 404:
-                _LOGGER.debug("[MotoGP API] <-- 404 (inactif) %s", url)
-                return None
-            resp.raise_for_status()
-            data = await resp.json()
-            _LOGGER.debug("[MotoGP API] <-- %s JSON: %s", url, data)
-            return data
-
 def _to_paris(dt_str: str | None) -> str:
     if not dt_str:
         return "n/a"
@@ -56,34 +66,241 @@ def _to_paris(dt_str: str | None) -> str:
     except Exception:
         return "n/a"
 
-class MotoGPConfigCoordinator(DataUpdateCoordinator[dict]):
-
-    def __init__(self, hass: HomeAssistant) -> None:
+def _discard(task: asyncio.Task | None) -> None:
+    if task is None:
+        return
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
+
+def serialize(data: dict | None, records: dict[str, type]) -> dict:
+    if not data:
+        return {}
+    out = dict(data)
+    for key in records:
+        if key in out:
+            out[key] = [r.as_dict() for r in out[key]]
+    return out
+
+def deserialize(data: dict, records: dict[str, type]) -> dict:
+    out = dict(data)
+    for key, cls in records.items():
+        if key in out:
+            out[key] = tuple(cls.from_dict(r) for r in out[key] or [])
+    return out
+
+def parse_standings(raw: Any) -> tuple[tuple[RiderStanding, ...], tuple[TeamStanding, ...]]:
+    if isinstance(raw, dict) and "classification" in raw:
+        riders_raw: list = raw["classification"]
+    elif isinstance(raw, dict) and "items" in raw:
+        riders_raw = raw["items"]
+    elif isinstance(raw, list):
+        riders_raw = raw
+    else:
+        _LOGGER.warning("[MotoGP Standings] Format inattendu : %s", type(raw))
+        riders_raw = []
+
+    riders: list[RiderStanding] = []
+    for r in riders_raw:
+        rider_info = r.get("rider") or {}
+        team_info  = r.get("team") or {}
+        country    = rider_info.get("country") or {}
+        riders.append(RiderStanding(
+            position        = r.get("position"),
+            full_name       = rider_info.get("full_name", ""),
+            number          = str(rider_info.get("number", "")),
+            country_iso     = (country.get("iso", "") or "").lower(),
+            country_name    = country.get("name", ""),
+            team            = team_info.get("name", ""),
+            points          = r.get("points", 0),
+            wins            = r.get("race_wins", 0),
+            podiums         = r.get("podiums", 0),
+            sprint_wins     = r.get("sprint_wins", 0),
+            sprint_podiums  = r.get("sprint_podiums", 0),
+            riders_api_uuid = rider_info.get("riders_api_uuid", ""),
+        ))
+
+    teams_pts: dict[str, int] = {}
+    for r in riders:
+        team = r.team or "Unknown"
+        teams_pts[team] = teams_pts.get(team, 0) + int(r.points or 0)
+
+    teams = tuple(
+        TeamStanding(position=i, name=name, points=pts)
+        for i, (name, pts) in enumerate(
+            sorted(teams_pts.items(), key=lambda x: x[1], reverse=True), start=1
+        )
+    )
+    return tuple(riders), teams
+
+def parse_live(raw: dict) -> tuple[str, int | None, tuple[LiveRow, ...]]:
+    head           = raw.get("head") or {}
+    session_status = (head.get("session_status_name") or "").lower()
+    total_laps     = head.get("num_laps")
+
+    riders_raw = raw.get("rider") or {}
+    rows: list[LiveRow] = []
+
+    for _, r in riders_raw.items():
+        rows.append(LiveRow(
+            pos       = r.get("pos"),
+            number    = str(r.get("rider_number", "")),
+            name      = f"{r.get('rider_name', '')} {r.get('rider_surname', '')}".strip(),
+            nation    = r.get("rider_nation", ""),
+            team      = r.get("team_name", ""),
+            bike      = r.get("bike_name", ""),
+            laps      = r.get("num_lap"),
+            gap_first = r.get("gap_first", "—"),
+            last_lap  = r.get("last_lap_time", ""),
+            status    = r.get("status_name", ""),
+        ))
+
+    rows.sort(key=lambda x: x.pos if isinstance(x.pos, int) and x.pos > 0 else 999)
+    return session_status, total_laps, tuple(rows)
+
+class _MotoGPCoordinator(DataUpdateCoordinator[dict]):
+
+    _persist_snapshot = True
+    _records: dict[str, type] = {}
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: MotoGPApiClient,
+        name: str,
+        update_interval: timedelta,
+        always_update: bool = False,
+    ) -> None:
         super().__init__(
             hass, _LOGGER,
-            name=f"{DOMAIN}_{COORD_CONFIG}",
-            update_interval=INTERVAL_CONFIG,
+            name=f"{DOMAIN}_{name}",
+            update_interval=update_interval,
+            always_update=always_update,
         )
+        self._client = client
+        self._snapshot: Store[dict] | None = (
+            Store(hass, STORAGE_VERSION, client.storage_key(STORAGE_KEY_SNAPSHOT.format(name=name)))
+            if self._persist_snapshot else None
+        )
+        self._view: dict = {}
+        self._view_of: dict | None = None
+        self._raw: Any = None
+        self.last_fetched: datetime | None = None
+        self.last_changed: datetime | None = None
+
+    def as_jsonable(self) -> dict:
+        if self._view_of is not self.data:
+            self._view    = serialize(self.data, self._records)
+            self._view_of = self.data
+        return self._view
+
+    def view(self, key: str) -> list:
+        return self.as_jsonable().get(key) or []
+
+    @property
+    def api_status(self) -> str:
+        return self._client.api_status
+
+    @callback
+    def image_url(self, url: str) -> str:
+        return self._client.images.local_url(url, self.async_update_listeners)
+
+    async def async_restore_snapshot(self) -> bool:
+        if self._snapshot is None:
+            return False
+        stored = await self._snapshot.async_load()
+        if not stored or stored.get("data") is None:
+            return False
+        self.async_set_updated_data(deserialize(stored["data"], self._records))
+        self.last_changed = dt_util.parse_datetime(stored.get("saved_at") or "")
+        _LOGGER.debug("[MotoGP] Snapshot %s restaure (%s)", self.name, stored.get("saved_at"))
+        return True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        started = time.monotonic()
+        with loop_guard(f"{self.name} listeners"):
+            super().async_update_listeners()
+        self._client.metrics.record_listeners(self.name, time.monotonic() - started)
 
     async def _async_update_data(self) -> dict:
+        started = time.monotonic()
+        metrics = self._client.metrics
+        try:
+            data = await self._async_update()
+        except UpdateFailed as err:
+            if isinstance(err.__cause__, CircuitOpenError) and self.data is not None:
+                _LOGGER.debug("[MotoGP] %s : %s, donnees precedentes conservees", self.name, err.__cause__)
+                metrics.record_update(self.name, time.monotonic() - started, False, False)
+                return self.data
+            metrics.record_update(self.name, time.monotonic() - started, False, False)
+            raise
+        now     = self.last_fetched = dt_util.utcnow()
+        changed = data is not self.data and data != self.data
+        metrics.record_update(self.name, time.monotonic() - started, True, changed)
+        if not changed:
+            return self.data
+        self.last_changed = now
+        if self._snapshot is not None:
+            saved_at = now.isoformat()
+            self._snapshot.async_delay_save(
+                lambda: {"saved_at": saved_at, "data": serialize(data, self._records)},
+                SNAPSHOT_SAVE_DELAY,
+            )
+        return data
+
+    async def _async_update(self) -> dict:
+        raise NotImplementedError
+
+class MotoGPConfigCoordinator(_MotoGPCoordinator):
+
+    def __init__(self, hass: HomeAssistant, client: MotoGPApiClient) -> None:
+        super().__init__(hass, client, COORD_CONFIG, INTERVAL_CONFIG)
+
+    async def _async_update(self) -> dict:
+        started     = time.monotonic()
+        prev_season = (self.data or {}).get("season_id")
+        speculative = (
+            asyncio.create_task(self._client.fetch(f"results/categories?seasonUuid={prev_season}"))
+            if prev_season else None
+        )
+
         try:
-            seasons: list = await _fetch("results/seasons")
+            seasons: list = await self._client.fetch("results/seasons")
         except Exception as err:
+            _discard(speculative)
             raise UpdateFailed(f"Saisons inaccessibles : {err}") from err
+        seasons_ms = (time.monotonic() - started) * 1000
 
         current = next((s for s in seasons if s.get("current") is True), None)
         if not current:
+            _discard(speculative)
             raise UpdateFailed("Aucune saison courante trouvee.")
 
         season_id   = str(current["id"])
         season_year = str(current.get("year", ""))
 
+        if speculative is not None and prev_season != season_id:
+            _discard(speculative)
+            speculative = None
+
         try:
-            categories: list = await _fetch(f"results/categories?seasonUuid={season_id}")
+            categories: list = await (
+                speculative
+                or self._client.fetch(f"results/categories?seasonUuid={season_id}")
+            )
         except Exception as err:
             raise UpdateFailed(f"Categories inaccessibles : {err}") from err
 
-        cat = next((c for c in categories if c.get("name") == "MotoGP™"), None)
+        _LOGGER.debug(
+            "[MotoGP Config] seasons=%.0f ms, categories=%.0f ms (%s)",
+            seasons_ms, (time.monotonic() - started) * 1000 - seasons_ms,
+            "anticipe" if speculative is not None else "sequentiel",
+        )
+
+        cat = next((c for c in categories if c.get("name") == CATEGORY_NAME), None)
         if not cat:
             raise UpdateFailed("Categorie MotoGP™ introuvable.")
 
@@ -94,18 +311,21 @@ class MotoGPConfigCoordinator(DataUpdateCoordinator[dict]):
             "category_id": str(cat["id"]),
         }
 
-class MotoGPStandingsCoordinator(DataUpdateCoordinator[dict]):
+class MotoGPStandingsCoordinator(_MotoGPCoordinator):
 
-    def __init__(self, hass: HomeAssistant, config: MotoGPConfigCoordinator) -> None:
-        super().__init__(
-            hass, _LOGGER,
-            name=f"{DOMAIN}_{COORD_STANDINGS}",
-            update_interval=INTERVAL_STANDINGS,
-        )
-        self._config = config
-        self._riders_cache: dict[str, dict] = {}
+    _records = {"riders": RiderStanding, "teams": TeamStanding}
 
-    async def _async_update_data(self) -> dict:
+    def __init__(
+        self, hass: HomeAssistant, client: MotoGPApiClient, config: MotoGPConfigCoordinator
+    ) -> None:
+        super().__init__(hass, client, COORD_STANDINGS, INTERVAL_STANDINGS)
+        self._config   = config
+        self._profiles = ProfileCache(hass, client.storage_key(STORAGE_KEY_PROFILES))
+        self._riders_by_uuid: dict[str, RiderStanding] = {}
+        self._indexed: dict | None = None
+        self._prefetch_task: asyncio.Task | None = None
+
+    async def _async_update(self) -> dict:
         if not self._config.data:
             raise UpdateFailed("Config non disponible.")
 
@@ -113,7 +333,7 @@ class MotoGPStandingsCoordinator(DataUpdateCoordinator[dict]):
         category_id = self._config.data["category_id"]
 
         try:
-            raw = await _fetch(
+            raw = await self._client.fetch(
                 f"results/standings?seasonUuid={season_id}&categoryUuid={category_id}"
             )
         except Exception as err:
@@ -121,161 +341,232 @@ class MotoGPStandingsCoordinator(DataUpdateCoordinator[dict]):
 
         if raw is None:
             _LOGGER.debug("[MotoGP Standings] Pas de classement disponible (404)")
-            return {"season_year": self._config.data["season_year"], "riders": [], "teams": []}
-
-        if isinstance(raw, dict) and "classification" in raw:
-            riders_raw: list = raw["classification"]
-        elif isinstance(raw, dict) and "items" in raw:
-            riders_raw = raw["items"]
-        elif isinstance(raw, list):
-            riders_raw = raw
-        else:
-            _LOGGER.warning("[MotoGP Standings] Format inattendu : %s", type(raw))
-            riders_raw = []
-
-        riders: list[dict] = []
-        for r in riders_raw:
-            rider_info = r.get("rider") or {}
-            team_info  = r.get("team") or {}
-            country    = rider_info.get("country") or {}
-            riders.append({
-                "position":        r.get("position"),
-                "full_name":       rider_info.get("full_name", ""),
-                "number":          str(rider_info.get("number", "")),
-                "country_iso":     (country.get("iso", "") or "").lower(),
-                "country_name":    country.get("name", ""),
-                "team":            team_info.get("name", ""),
-                "points":          r.get("points", 0),
-                "wins":            r.get("race_wins", 0),
-                "podiums":         r.get("podiums", 0),
-                "sprint_wins":     r.get("sprint_wins", 0),
-                "sprint_podiums":  r.get("sprint_podiums", 0),
-                "riders_api_uuid": rider_info.get("riders_api_uuid", ""),
-            })
+            self._raw = None
+            return {"season_year": self._config.data["season_year"], "riders": (), "teams": ()}
 
-        teams_pts: dict[str, int] = {}
-        for r in riders:
-            team = r["team"] or "Unknown"
-            teams_pts[team] = teams_pts.get(team, 0) + int(r["points"] or 0)
+        if raw is self._raw and self.data is not None:
+            _LOGGER.debug("[MotoGP Standings] Classement inchange, analyse ignoree")
+            return self.data
 
-        teams: list[dict] = [
-            {"position": i, "name": name, "points": pts}
-            for i, (name, pts) in enumerate(
-                sorted(teams_pts.items(), key=lambda x: x[1], reverse=True), start=1
-            )
-        ]
+        with loop_guard("standings", self._client.metrics):
+            riders, teams = parse_standings(raw)
 
         _LOGGER.debug("[MotoGP Standings] %d pilotes, %d equipes", len(riders), len(teams))
+        self._raw = raw
+        self._schedule_prefetch()
         return {
             "season_year": self._config.data["season_year"],
             "riders":      riders,
             "teams":       teams,
         }
 
-    async def async_get_rider_profile(self, riders_api_uuid: str) -> dict | None:
-        if riders_api_uuid not in self._riders_cache:
-            try:
-                raw = await _fetch(f"riders/{riders_api_uuid}")
-            except Exception as err:
-                _LOGGER.warning("[MotoGP Rider] Profil inaccessible (%s) : %s", riders_api_uuid, err)
-                return None
-
-            if raw is None:
-                return None
+    def _rider_stats(self, riders_api_uuid: str) -> RiderStanding | None:
+        if self._indexed is not self.data:
+            self._riders_by_uuid = {
+                r.riders_api_uuid: r
+                for r in (self.data or {}).get("riders", ()) if r.riders_api_uuid
+            }
+            self._indexed = self.data
+        return self._riders_by_uuid.get(riders_api_uuid)
 
-            self._riders_cache[riders_api_uuid] = raw
-            _LOGGER.debug("[MotoGP Rider] Profil mis en cache : %s", riders_api_uuid)
+    async def _async_profile(self, riders_api_uuid: str) -> dict | None:
+        await self._profiles.async_load()
+        if (profile := self._profiles.get(riders_api_uuid)) is not None:
+            return profile
 
-        raw = self._riders_cache[riders_api_uuid]
+        try:
+            raw = await self._client.fetch(f"riders/{riders_api_uuid}")
+        except Exception as err:
+            _LOGGER.warning("[MotoGP Rider] Profil inaccessible (%s) : %s", riders_api_uuid, err)
+            return None
 
-        photo_url = ""
-        for step in raw.get("career") or []:
-            if step.get("current"):
-                photo_url = (step.get("pictures") or {}).get("profile", {}).get("main") or ""
-                break
+        if raw is None:
+            return None
 
-        stats = {}
-        for r in (self.data or {}).get("riders", []):
-            if r.get("riders_api_uuid", "") == riders_api_uuid:
-                stats = r
-                break
+        profile = project_profile(raw)
+        self._profiles.put(riders_api_uuid, profile)
+        _LOGGER.debug("[MotoGP Rider] Profil mis en cache : %s", riders_api_uuid)
+        return profile
 
-        country = raw.get("country") or {}
-        phys    = raw.get("physical_attributes") or {}
+    async def async_get_rider_profile(self, riders_api_uuid: str) -> dict | None:
+        profile = await self._async_profile(riders_api_uuid)
+        if profile is None:
+            return None
 
+        images = self._client.images
+        stats  = self._rider_stats(riders_api_uuid)
         return {
-            "photo_url":     photo_url,
-            "age":           raw.get("years_old"),
-            "birth_city":    raw.get("birth_city", ""),
-            "height":        phys.get("height"),
-            "weight":        phys.get("weight"),
-            "country_iso":   (country.get("iso") or "").lower(),
-            "country_name":  country.get("name", ""),
-            "country_flag":  country.get("flag", ""),
-            "position":      stats.get("position"),
-            "points":        stats.get("points", 0),
-            "race_wins":     stats.get("wins", 0),
-            "podiums":       stats.get("podiums", 0),
-            "sprint_wins":   stats.get("sprint_wins", 0),
-            "sprint_podiums":stats.get("sprint_podiums", 0),
+            **profile,
+            "photo_url":     images.local_url(profile.get("photo_url", "")),
+            "country_flag":  images.local_url(profile.get("country_flag", "")),
+            "position":      stats.position if stats else None,
+            "points":        stats.points if stats else 0,
+            "race_wins":     stats.wins if stats else 0,
+            "podiums":       stats.podiums if stats else 0,
+            "sprint_wins":   stats.sprint_wins if stats else 0,
+            "sprint_podiums":stats.sprint_podiums if stats else 0,
         }
 
-class MotoGPEventCoordinator(DataUpdateCoordinator[dict]):
+    async def async_get_rider_profiles(self, uuids: list[str] | None = None) -> dict[str, dict | None]:
+        if not uuids:
+            uuids = [
+                r.riders_api_uuid
+                for r in (self.data or {}).get("riders", ()) if r.riders_api_uuid
+            ]
+        semaphore = asyncio.Semaphore(PROFILE_PREFETCH_CONCURRENCY)
 
-    def __init__(self, hass: HomeAssistant, config: MotoGPConfigCoordinator) -> None:
-        super().__init__(
-            hass, _LOGGER,
-            name=f"{DOMAIN}_{COORD_EVENT}",
-            update_interval=INTERVAL_EVENT,
+        async def _one(uuid: str) -> dict | None:
+            async with semaphore:
+                return await self.async_get_rider_profile(uuid)
+
+        results = await asyncio.gather(*(_one(u) for u in uuids))
+        return dict(zip(uuids, results))
+
+    async def _async_prefetch_profiles(self) -> None:
+        profiles = await self.async_get_rider_profiles()
+        _LOGGER.debug(
+            "[MotoGP Rider] Prechargement : %d/%d profils disponibles",
+            sum(p is not None for p in profiles.values()), len(profiles),
         )
-        self._config = config
 
-    async def _async_update_data(self) -> dict:
-        if not self._config.data:
-            raise UpdateFailed("Config non disponible.")
+    @callback
+    def _schedule_prefetch(self) -> None:
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            return
+        self._prefetch_task = self.hass.async_create_background_task(
+            self._async_prefetch_profiles(), f"{DOMAIN}_profile_prefetch"
+        )
 
-        season_id   = self._config.data["season_id"]
-        category_id = self._config.data["category_id"]
+    async def async_shutdown(self) -> None:
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+        await super().async_shutdown()
+
+class MotoGPEventCoordinator(_MotoGPCoordinator):
+
+    _records = {"sessions": SessionRow}
+
+    def __init__(
+        self, hass: HomeAssistant, client: MotoGPApiClient, config: MotoGPConfigCoordinator
+    ) -> None:
+        super().__init__(hass, client, COORD_EVENT, INTERVAL_EVENT)
+        self._config = config
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+        self._index_store: Store[dict] = Store(hass, STORAGE_VERSION, client.storage_key(STORAGE_KEY_INDEX))
+        self._index: SeasonIndex | None = None
+        self._index_loaded = False
+        self._index_dirty  = False
+        self._picked_uuid: str | None = None
+
+    def _schedule_boundary(self, event: dict | None, sessions: tuple[SessionRow, ...]) -> None:
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
+        when = next_boundary(event, sessions, dt_util.utcnow())
+        if when is None:
+            return
+        _LOGGER.debug("[MotoGP Event] Prochain rafraichissement cale sur %s", when.isoformat())
+        self._unsub_boundary = async_track_point_in_utc_time(self.hass, self._handle_boundary, when)
+
+    @callback
+    def _handle_boundary(self, _now: datetime) -> None:
+        self._unsub_boundary = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+        await super().async_shutdown()
+
+    def invalidate_index(self) -> None:
+        self._index_dirty = True
+
+    async def _async_get_index(self, season_id: str) -> SeasonIndex:
+        if not self._index_loaded:
+            self._index_loaded = True
+            stored = await self._index_store.async_load()
+            if stored:
+                self._index = SeasonIndex.from_dict(stored)
+
+        now   = dt_util.utcnow()
+        index = self._index
+        if (
+            index is not None
+            and index.season_id == season_id
+            and not index.is_stale(now)
+            and not self._index_dirty
+        ):
+            return index
 
         try:
-            events: list = await _fetch(f"results/events?seasonUuid={season_id}")
+            events: list = await self._client.fetch(f"results/events?seasonUuid={season_id}")
         except Exception as err:
+            if index is not None and index.season_id == season_id:
+                _LOGGER.warning("[MotoGP Event] Revalidation calendrier echouee, index conserve : %s", err)
+                return index
             raise UpdateFailed(f"Events inaccessibles : {err}") from err
 
         if not isinstance(events, list):
             raise UpdateFailed(f"Format events inattendu : {type(events)}")
 
-        event = self._pick_next(events)
+        with loop_guard("season_index", self._client.metrics):
+            fresh = SeasonIndex.from_events(season_id, events)
+        if index is not None and index.season_id == season_id and index.entries == fresh.entries:
+            index.fetched_at = fresh.fetched_at
+            _LOGGER.debug("[MotoGP Event] Calendrier %s inchange", season_id)
+        else:
+            index = self._index = fresh
+            _LOGGER.info("[MotoGP Event] Calendrier %s indexe (%d evenements)", season_id, len(index.entries))
+
+        self._index_dirty = False
+        self._index_store.async_delay_save(index.as_dict, INDEX_SAVE_DELAY)
+        return index
+
+    async def _async_update(self) -> dict:
+        if not self._config.data:
+            raise UpdateFailed("Config non disponible.")
+
+        season_id   = self._config.data["season_id"]
+        category_id = self._config.data["category_id"]
+
+        index = await self._async_get_index(season_id)
+        event = index.pick(dt_util.utcnow())
+        if event and self._picked_uuid is not None and event["uuid"] != self._picked_uuid:
+            self.invalidate_index()
+            index = await self._async_get_index(season_id)
+            event = index.pick(dt_util.utcnow())
+        self._picked_uuid = event["uuid"] if event else None
+
         if not event:
             _LOGGER.info("[MotoGP Event] Aucun evenement a venir.")
-            return {"event": None, "sessions": [], "race_uuid": None}
-
-        circuit = event.get("circuit") or {}
-        country = event.get("country") or {}
-        cname   = (circuit.get("name") or circuit.get("place") or "").strip()
-        slug    = CIRCUIT_SLUGS.get(cname.lower(), "")
-        iso     = (country.get("iso", "") or "").lower()
+            self._raw = None
+            self._schedule_boundary(None, ())
+            return {"event": None, "sessions": (), "race_uuid": None}
 
-        if not slug:
-            _LOGGER.warning("[MotoGP Event] Slug inconnu pour '%s'", cname)
+        slug = event["circuit_slug"]
+        iso  = event["country_iso"]
+        flag = f"https://flagcdn.com/48x36/{iso}.png" if iso else ""
 
         event_data = {
-            "uuid":             str(event.get("id") or event.get("uuid") or ""),
-            "name":             event.get("name", ""),
-            "status":           (event.get("status") or "").upper(),
-            "date_start":       event.get("date_start", ""),
-            "date_end":         event.get("date_end", ""),
-            "date_start_local": _to_paris(event.get("date_start")),
-            "date_end_local":   _to_paris(event.get("date_end")),
-            "country_name":     country.get("name", ""),
+            "uuid":             event["uuid"],
+            "name":             event["name"],
+            "status":           event["status"],
+            "date_start":       event["date_start"],
+            "date_end":         event["date_end"],
+            "date_start_local": _to_paris(event["date_start"]),
+            "date_end_local":   _to_paris(event["date_end"]),
+            "country_name":     event["country_name"],
             "country_iso":      iso,
-            "flag_url":         f"https://flagcdn.com/48x36/{iso}.png" if iso else "",
-            "circuit_name":     cname,
+            "flag_url":         flag,
+            "circuit_name":     event["circuit_name"],
             "circuit_slug":     slug,
-            "circuit_svg":      CIRCUIT_SVG_PATH.format(slug=slug) if slug else "",
+            "circuit_svg":      circuit_svg_url(self.hass, slug) if slug else "",
         }
 
         sessions, race_uuid = await self._fetch_sessions(event_data["uuid"], category_id)
+        self._schedule_boundary(event_data, sessions)
 
         _LOGGER.info(
             "[MotoGP Event] %s — slug=%s — %d sessions — race_uuid=%s",
@@ -287,45 +578,29 @@ class MotoGPEventCoordinator(DataUpdateCoordinator[dict]):
             "race_uuid": race_uuid,
         }
 
-    @staticmethod
-    def _pick_next(events: list) -> dict | None:
-        gps = [e for e in events if not e.get("test", False)]
-
-        for e in gps:
-            if (e.get("status") or "").upper() == "CURRENT":
-                return e
-
-        now = dt_util.now()
-        upcoming: list[tuple[datetime, dict]] = []
-        for e in gps:
-            ds = e.get("date_start")
-            if not ds:
-                continue
-            try:
-                dt = datetime.fromisoformat(ds)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=pytz.UTC)
-                if dt > now:
-                    upcoming.append((dt, e))
-            except Exception:
-                continue
-
-        return min(upcoming, key=lambda x: x[0])[1] if upcoming else None
-
-    @staticmethod
-    async def _fetch_sessions(event_uuid: str, category_id: str) -> tuple[list[dict], str | None]:
+    async def _fetch_sessions(
+        self, event_uuid: str, category_id: str
+    ) -> tuple[tuple[SessionRow, ...], str | None]:
         try:
-            raw: list = await _fetch(
+            raw: list = await self._client.fetch(
                 f"results/sessions?eventUuid={event_uuid}&categoryUuid={category_id}"
             )
         except Exception as err:
-            _LOGGER.warning("[MotoGP Event] Sessions inaccessibles : %s", err)
-            return [], None
+            previous = self.data or {}
+            if ((previous.get("event") or {}).get("uuid")) == event_uuid:
+                _LOGGER.warning("[MotoGP Event] Sessions inaccessibles, sessions precedentes conservees : %s", err)
+                return previous["sessions"], previous["race_uuid"]
+            raise UpdateFailed(f"Sessions inaccessibles : {err}") from err
 
         if not isinstance(raw, list):
-            return [], None
+            self._raw = None
+            return (), None
 
-        sessions: list[dict] = []
+        if raw is self._raw and self.data is not None:
+            _LOGGER.debug("[MotoGP Event] Sessions inchangees, analyse ignoree")
+            return self.data["sessions"], self.data["race_uuid"]
+
+        sessions: list[SessionRow] = []
         race_uuid: str | None = None
 
         for s in raw:
@@ -333,96 +608,192 @@ class MotoGPEventCoordinator(DataUpdateCoordinator[dict]):
             if s_type not in SESSION_TYPES_KEPT:
                 continue
             sid = str(s.get("id") or "")
-            sessions.append({
-                "id":          sid,
-                "type":        s_type,
-                "start_utc":   s.get("date", ""),
-                "start_local": _to_paris(s.get("date")),
-                "status":      (s.get("status") or "").upper(),
-            })
+            sessions.append(SessionRow(
+                id          = sid,
+                type        = s_type,
+                start_utc   = s.get("date", ""),
+                start_local = _to_paris(s.get("date")),
+                status      = (s.get("status") or "").upper(),
+            ))
             if s_type == "RAC":
                 race_uuid = sid
 
-        sessions.sort(key=lambda s: s.get("start_utc") or "")
-        return sessions, race_uuid
-
-class MotoGPLiveTimingCoordinator(DataUpdateCoordinator[dict]):
-
-    def __init__(self, hass: HomeAssistant, event: MotoGPEventCoordinator) -> None:
-        super().__init__(
-            hass, _LOGGER,
-            name=f"{DOMAIN}_{COORD_LIVE}",
-            update_interval=INTERVAL_LIVE,
-        )
-        self._event = event
+        sessions.sort(key=lambda s: s.start_utc or "")
+        self._raw = raw
+        return tuple(sessions), race_uuid
+
+class MotoGPLiveTimingCoordinator(_MotoGPCoordinator):
+
+    _persist_snapshot = False
+    _records = {"classification": LiveRow}
+
+    def __init__(
+        self, hass: HomeAssistant, client: MotoGPApiClient, event: MotoGPEventCoordinator
+    ) -> None:
+        super().__init__(hass, client, COORD_LIVE, INTERVAL_LIVE)
+        self._event    = event
+        self._phase    = LIVE_PHASE_DORMANT
+        self._live_id: str | None = None
+        self._finished: dict[str, datetime] = {}
+        self._target:   str | None = None
+        self._results:  dict[str, dict] = {}
+        self._results_event: str | None = None
+        self._delta    = LiveDeltaEngine()
+        self._delta_session: str | None = None
+        self._last_status:   str | None = None
+        self.last_delta = LiveDelta()
+        self.lap_history = LapHistory()
+        self._unsub_event: CALLBACK_TYPE | None = event.async_add_listener(self._handle_event_update)
+
+    def _schedule(self) -> LiveSchedule:
+        sessions = (self._event.data or {}).get("sessions", ())
+        return live_schedule(sessions, dt_util.utcnow(), self._live_id, self._finished)
+
+    @callback
+    def _handle_event_update(self) -> None:
+        schedule = self._schedule()
+        target   = schedule.session.id if schedule.session else None
+        if schedule.phase != self._phase or target != self._target:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def session_results(self, session_uuid: str) -> dict | None:
+        results = self._results.get(session_uuid)
+        return serialize(results, self._records) if results is not None else None
+
+    @property
+    def tracked_session(self) -> str | None:
+        return self._delta_session
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_event is not None:
+            self._unsub_event()
+            self._unsub_event = None
+        await super().async_shutdown()
+
+    def _fire_events(self, session_uuid: str, session_status: str, delta: LiveDelta) -> None:
+        fire = self.hass.bus.async_fire
+
+        if self._last_status is not None and session_status != self._last_status:
+            fire(EVENT_SESSION_STATUS, {
+                "session_uuid": session_uuid, "from": self._last_status, "to": session_status,
+            })
+        self._last_status = session_status
+
+        for overtake in delta.overtakes:
+            fire(EVENT_OVERTAKE, {"session_uuid": session_uuid, **overtake})
+        for lap in delta.laps:
+            fire(EVENT_LAP_COMPLETED, {"session_uuid": session_uuid, **lap})
+        if delta.fastest_lap:
+            fire(EVENT_FASTEST_LAP, {"session_uuid": session_uuid, **delta.fastest_lap})
+        for change in delta.status_changes:
+            fire(EVENT_STATUS_CHANGE, {"session_uuid": session_uuid, **change})
+        for retirement in delta.retirements:
+            fire(EVENT_RETIREMENT, {"session_uuid": session_uuid, **retirement})
+
+    def _idle(self, status: str, phase: str, session: SessionRow | None) -> dict:
+        self._raw = None
+        return {
+            "active":         False,
+            "session_status": status,
+            "phase":          phase,
+            "total_laps":     None,
+            "current_lap":    None,
+            "race_uuid":      (self._event.data or {}).get("race_uuid"),
+            "session_uuid":   session.id if session else None,
+            "session_type":   session.type if session else None,
+            "classification": (),
+        }
 
-    async def _async_update_data(self) -> dict:
-        race_uuid = (self._event.data or {}).get("race_uuid")
-
-        if not race_uuid:
-            return {
-                "active":         False,
-                "session_status": "inactive",
-                "total_laps":     None,
-                "current_lap":    None,
-                "race_uuid":      None,
-                "classification": [],
-            }
+    async def _async_update(self) -> dict:
+        self.last_delta = LiveDelta()
+        event_uuid = ((self._event.data or {}).get("event") or {}).get("uuid")
+        if event_uuid != self._results_event:
+            self._results       = {}
+            self._finished      = {}
+            self._results_event = event_uuid
+
+        schedule = self._schedule()
+        session  = schedule.session
+        self._phase          = schedule.phase
+        self._target         = session.id if session else None
+        self.update_interval = schedule.interval
+
+        if session is None:
+            if self.data and self.data.get("session_uuid") in self._results:
+                return {**self.data, "phase": schedule.phase}
+            return self._idle("inactive", schedule.phase, None)
+
+        session_uuid = session.id
+
+        if schedule.phase == LIVE_PHASE_DORMANT:
+            _LOGGER.debug(
+                "[MotoGP Live] En veille, prochain reveil dans %s (session %s %s)",
+                schedule.interval, session.type, session_uuid,
+            )
+            if self.data and self.data.get("session_uuid") in self._results:
+                return {**self.data, "phase": schedule.phase}
+            return self._idle("inactive", schedule.phase, session)
 
         try:
-            raw = await _fetch(f"timing-gateway/livetiming-lite?sessionUuid={race_uuid}")
+            raw = await self._client.fetch(f"timing-gateway/livetiming-lite?sessionUuid={session_uuid}")
         except Exception as err:
             raise UpdateFailed(f"Live timing inaccessible : {err}") from err
 
         if raw is None:
-            _LOGGER.debug("[MotoGP Live] 404 — session non demarree (race_uuid=%s)", race_uuid)
-            return {
-                "active":         False,
-                "session_status": "waiting",
-                "total_laps":     None,
-                "current_lap":    None,
-                "race_uuid":      race_uuid,
-                "classification": [],
-            }
-
-        head           = raw.get("head") or {}
-        session_status = (head.get("session_status_name") or "").lower()
-        total_laps     = head.get("num_laps")
-        is_active      = session_status in LIVE_STATUSES
-
-        riders_raw = raw.get("rider") or {}
-        classification: list[dict] = []
-
-        for _, r in riders_raw.items():
-            classification.append({
-                "pos":       r.get("pos"),
-                "number":    str(r.get("rider_number", "")),
-                "name":      f"{r.get('rider_name', '')} {r.get('rider_surname', '')}".strip(),
-                "nation":    r.get("rider_nation", ""),
-                "team":      r.get("team_name", ""),
-                "bike":      r.get("bike_name", ""),
-                "laps":      r.get("num_lap"),
-                "gap_first": r.get("gap_first", "—"),
-                "last_lap":  r.get("last_lap_time", ""),
-                "status":    r.get("status_name", ""),
-            })
-
-        classification.sort(
-            key=lambda x: x["pos"] if isinstance(x["pos"], int) and x["pos"] > 0 else 999
-        )
-
-        leader      = next((r for r in classification if r["pos"] == 1), None)
-        current_lap = leader["laps"] if leader else None
+            _LOGGER.debug(
+                "[MotoGP Live] 404 — session non demarree (%s %s)", session.type, session_uuid
+            )
+            return self._idle("waiting", schedule.phase, session)
+
+        if raw is self._raw and self.data and self.data.get("session_uuid") == session_uuid:
+            _LOGGER.debug("[MotoGP Live] Timing inchange (%s %s)", session.type, session_uuid)
+            return {**self.data, "phase": schedule.phase}
+
+        with loop_guard("live", self._client.metrics):
+            session_status, total_laps, classification = parse_live(raw)
+            is_active = session_status in LIVE_STATUSES
+
+        leader      = next((r for r in classification if r.pos == 1), None)
+        current_lap = leader.laps if leader else None
+
+        if session_uuid != self._delta_session:
+            self._delta.reset()
+            self.lap_history.reset()
+            self._delta_session = session_uuid
+            self._last_status   = None
+        with loop_guard("live_delta", self._client.metrics):
+            self.last_delta = self._delta.update(classification)
+            self.lap_history.record(classification, total_laps)
+            self._fire_events(session_uuid, session_status, self.last_delta)
+
+        if is_active:
+            self._live_id = session_uuid
+        elif self._live_id == session_uuid:
+            self._live_id = None
+            self._finished[session_uuid] = dt_util.utcnow()
+
+        schedule = self._schedule()
+        self._phase          = schedule.phase
+        self._target         = schedule.session.id if schedule.session else None
+        self.update_interval = schedule.interval
 
         _LOGGER.debug(
-            "[MotoGP Live] status=%s active=%s pilotes=%d tour=%s/%s",
-            session_status, is_active, len(classification), current_lap, total_laps,
+            "[MotoGP Live] %s status=%s active=%s phase=%s pilotes=%d tour=%s/%s",
+            session.type, session_status, is_active, schedule.phase,
+            len(classification), current_lap, total_laps,
         )
-        return {
+        data = {
             "active":         is_active,
             "session_status": session_status,
+            "phase":          schedule.phase,
             "total_laps":     total_laps,
             "current_lap":    current_lap,
-            "race_uuid":      race_uuid,
+            "race_uuid":      (self._event.data or {}).get("race_uuid"),
+            "session_uuid":   session_uuid,
+            "session_type":   session.type,
             "classification": classification,
         }
+        self._raw = raw
+        if classification:
+            self._results[session_uuid] = data
+        return data
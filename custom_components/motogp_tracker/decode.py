@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+SCHEMAS: dict[str, tuple[str, ...]] = {
+    "results/standings":              ("classification", "items"),
+    "results/session/":               ("classification",),
+    "timing-gateway/livetiming-lite": ("head", "rider"),
+    "riders/":                        ("years_old", "birth_city", "physical_attributes", "country", "career"),
+}
+
+SCHEMA_VERSION = hashlib.blake2b(repr(sorted(SCHEMAS.items())).encode(), digest_size=4).hexdigest()
+
+def schema_for(endpoint: str) -> tuple[str, ...] | None:
+    for prefix, keys in SCHEMAS.items():
+        if endpoint.startswith(prefix):
+            return keys
+    return None
+
+def project(value: Any, keys: tuple[str, ...] | None) -> Any:
+    if keys is None or not isinstance(value, dict):
+        return value
+    return {key: value[key] for key in keys if key in value}
+
+def decode(endpoint: str, body: bytes) -> Any:
+    return project(json_loads(body), schema_for(endpoint))
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, KEY_CLIENT, KEY_COORDINATORS
+
+def _isoformat(value) -> str | None:
+    return value.isoformat() if value else None
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client     = entry_data[KEY_CLIENT]
+    return {
+        "options":    dict(entry.options),
+        "base_url":   client.base_url,
+        "api_status": client.api_status,
+        "breakers":   client.breaker_states(),
+        "http_cache": client.cache_stats(),
+        "images":     client.images.stats(),
+        "metrics":    client.metrics.as_dict(),
+        "coordinators": {
+            key: {
+                "last_update_success": coord.last_update_success,
+                "update_interval_s":   coord.update_interval.total_seconds() if coord.update_interval else None,
+                "last_fetched":        _isoformat(coord.last_fetched),
+                "last_changed":        _isoformat(coord.last_changed),
+                "data":                coord.as_jsonable(),
+            }
+            for key, coord in entry_data[KEY_COORDINATORS].items()
+        },
+    }
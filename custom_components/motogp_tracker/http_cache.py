@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    HTTP_CACHE_MAX_BYTES,
+    HTTP_CACHE_MAX_ENTRIES,
+    HTTP_CACHE_SAVE_DELAY,
+    HTTP_CACHE_TTLS,
+    STORAGE_KEY_HTTP_CACHE,
+    STORAGE_VERSION,
+)
+from .decode import SCHEMA_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+def cache_ttl(endpoint: str) -> timedelta | None:
+    for prefix, ttl in HTTP_CACHE_TTLS.items():
+        if endpoint.startswith(prefix):
+            return ttl
+    return None
+
+class ResponseCache:
+
+    def __init__(self, hass: HomeAssistant, key: str = STORAGE_KEY_HTTP_CACHE) -> None:
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, key)
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._size   = 0
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        stored = await self._store.async_load()
+        for endpoint, entry in ((stored or {}).get("entries") or {}).items():
+            if entry.get("schema") != SCHEMA_VERSION:
+                continue
+            self._entries[endpoint] = entry
+            self._size += entry.get("size", 0)
+        self._evict()
+        _LOGGER.debug("[MotoGP Cache] %d reponses restaurees (%d octets)", len(self._entries), self._size)
+
+    def get(self, endpoint: str) -> dict[str, Any] | None:
+        entry = self._entries.get(endpoint)
+        if entry is None:
+            return None
+        ttl = cache_ttl(endpoint)
+        if ttl is None or time.time() - entry["stored_at"] > ttl.total_seconds():
+            self.discard(endpoint)
+            return None
+        self._entries.move_to_end(endpoint)
+        return entry
+
+    def validators(self, endpoint: str) -> dict[str, str]:
+        entry = self.get(endpoint)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(
+        self, endpoint: str, data: Any, size: int, etag: str | None, last_modified: str | None
+    ) -> None:
+        if cache_ttl(endpoint) is None or not (etag or last_modified):
+            return
+        self.discard(endpoint, save=False)
+        self._entries[endpoint] = {
+            "schema":        SCHEMA_VERSION,
+            "etag":          etag,
+            "last_modified": last_modified,
+            "stored_at":     time.time(),
+            "size":          size,
+            "data":          data,
+        }
+        self._size += size
+        self._evict()
+        self._save()
+
+    def touch(self, endpoint: str) -> None:
+        if (entry := self._entries.get(endpoint)) is not None:
+            entry["stored_at"] = time.time()
+            self._save()
+
+    def discard(self, endpoint: str, save: bool = True) -> None:
+        entry = self._entries.pop(endpoint, None)
+        if entry is not None:
+            self._size -= entry.get("size", 0)
+            if save:
+                self._save()
+
+    def _evict(self) -> None:
+        while self._entries and (
+            self._size > HTTP_CACHE_MAX_BYTES or len(self._entries) > HTTP_CACHE_MAX_ENTRIES
+        ):
+            endpoint, entry = self._entries.popitem(last=False)
+            self._size -= entry.get("size", 0)
+            _LOGGER.debug("[MotoGP Cache] Eviction %s", endpoint)
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self._size}
+
+    def _save(self) -> None:
+        self._store.async_delay_save(self._as_dict, HTTP_CACHE_SAVE_DELAY)
+
+    def _as_dict(self) -> dict[str, Any]:
+        return {"entries": dict(self._entries)}
+
+    async def async_flush(self) -> None:
+        if self._loaded:
+            await self._store.async_save(self._as_dict())
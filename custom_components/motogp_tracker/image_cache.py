@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    IMAGE_CACHE_DIR,
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_CACHE_SAVE_DELAY,
+    IMAGE_FETCH_CONCURRENCY,
+    IMAGE_MAX_BYTES,
+    IMAGE_RETRY_DELAY,
+    IMAGE_URL,
+    IMMUTABLE_CACHE_CONTROL,
+    KEY_CLIENT,
+    STORAGE_KEY_IMAGES,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_EXTENSIONS = {
+    "image/png":  "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/gif":  "gif",
+}
+
+class ImageCache:
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        get_session: Callable[[], aiohttp.ClientSession],
+        entry: ConfigEntry | None = None,
+    ) -> None:
+        self._hass        = hass
+        self._get_session = get_session
+        self._entry       = entry
+        self._dir         = hass.config.path(".storage", IMAGE_CACHE_DIR)
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, STORAGE_KEY_IMAGES)
+        self._files: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._urls:   dict[str, str] = {}
+        self._failed: dict[str, float] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+        self._waiters: dict[str, list[Callable[[], None]]] = {}
+        self._semaphore = asyncio.Semaphore(IMAGE_FETCH_CONCURRENCY)
+        self._size   = 0
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        stored = await self._store.async_load() or {}
+        present = set(await self._hass.async_add_executor_job(self._list_files))
+        for key, meta in (stored.get("files") or {}).items():
+            if meta.get("file") in present:
+                self._files[key] = meta
+                self._size += meta.get("size", 0)
+        self._urls = {
+            url: key for url, key in (stored.get("urls") or {}).items() if key in self._files
+        }
+        _LOGGER.debug("[MotoGP Images] %d images restaurees (%d octets)", len(self._files), self._size)
+
+    def _list_files(self) -> list[str]:
+        os.makedirs(self._dir, exist_ok=True)
+        return os.listdir(self._dir)
+
+    @callback
+    def local_url(self, url: str, on_ready: Callable[[], None] | None = None) -> str:
+        if not url or not url.startswith(("http://", "https://")):
+            return url
+
+        if (key := self._urls.get(url)) is not None and key in self._files:
+            self._files.move_to_end(key)
+            return IMAGE_URL.format(key=key)
+        if time.monotonic() - self._failed.get(url, -IMAGE_RETRY_DELAY) < IMAGE_RETRY_DELAY:
+            return url
+
+        if on_ready is not None and on_ready not in (waiters := self._waiters.setdefault(url, [])):
+            waiters.append(on_ready)
+        if url not in self._pending:
+            task = self._create_task(self._async_fetch(url), f"{DOMAIN}_image")
+            if not task.done():
+                self._pending[url] = task
+                task.add_done_callback(lambda _: self._pending.pop(url, None))
+        return url
+
+    def _create_task(self, target: Coroutine[Any, Any, None], name: str) -> asyncio.Task:
+        if self._entry is not None:
+            return self._entry.async_create_background_task(self._hass, target, name)
+        return self._hass.async_create_background_task(target, name)
+
+    async def _async_fetch(self, url: str) -> None:
+        try:
+            await self.async_load()
+            if url not in self._urls:
+                await self._async_download(url)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            _LOGGER.debug("[MotoGP Images] Echec %s : %s", url, err)
+            self._failed[url] = time.monotonic()
+        finally:
+            waiters = self._waiters.pop(url, [])
+        if url in self._urls:
+            for on_ready in waiters:
+                on_ready()
+
+    async def _async_download(self, url: str) -> None:
+        async with self._semaphore:
+            try:
+                async with self._get_session().get(
+                    url, timeout=aiohttp.ClientTimeout(total=20)
+                ) as resp:
+                    resp.raise_for_status()
+                    content_type = resp.content_type
+                    body = await resp.content.read(IMAGE_MAX_BYTES + 1)
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:
+                _LOGGER.debug("[MotoGP Images] Echec %s : %s", url, err)
+                self._failed[url] = time.monotonic()
+                return
+
+        if content_type not in _EXTENSIONS or not body or len(body) > IMAGE_MAX_BYTES:
+            _LOGGER.debug("[MotoGP Images] Image refusee %s (%s, %d octets)", url, content_type, len(body))
+            self._failed[url] = time.monotonic()
+            return
+
+        key = f"{hashlib.sha256(body).hexdigest()[:24]}.{_EXTENSIONS[content_type]}"
+        if key not in self._files:
+            try:
+                await self._hass.async_add_executor_job(self._write, key, body)
+            except OSError as err:
+                _LOGGER.warning("[MotoGP Images] Ecriture impossible %s : %s", key, err)
+                return
+            self._files[key] = {"file": key, "size": len(body), "content_type": content_type}
+            self._size += len(body)
+            _LOGGER.debug("[MotoGP Images] %s -> %s (%d octets)", url, key, len(body))
+        self._files.move_to_end(key)
+        self._urls[url] = key
+        self._failed.pop(url, None)
+        await self._async_evict()
+        self._store.async_delay_save(self._as_dict, IMAGE_CACHE_SAVE_DELAY)
+
+    def _write(self, key: str, body: bytes) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        tmp = os.path.join(self._dir, f".{key}.tmp")
+        with open(tmp, "wb") as fh:
+            fh.write(body)
+        os.replace(tmp, os.path.join(self._dir, key))
+
+    def _remove(self, keys: list[str]) -> None:
+        for key in keys:
+            try:
+                os.remove(os.path.join(self._dir, key))
+            except FileNotFoundError:
+                pass
+
+    async def _async_evict(self) -> None:
+        evicted: list[str] = []
+        while len(self._files) > 1 and self._size > IMAGE_CACHE_MAX_BYTES:
+            key, meta = self._files.popitem(last=False)
+            self._size -= meta.get("size", 0)
+            evicted.append(key)
+        if not evicted:
+            return
+        self._urls = {url: key for url, key in self._urls.items() if key in self._files}
+        await self._hass.async_add_executor_job(self._remove, evicted)
+        _LOGGER.debug("[MotoGP Images] %d images evincees", len(evicted))
+
+    async def async_read(self, key: str) -> tuple[bytes, str] | None:
+        await self.async_load()
+        if (meta := self._files.get(key)) is None:
+            return None
+        self._files.move_to_end(key)
+        try:
+            body = await self._hass.async_add_executor_job(self._read, key)
+        except FileNotFoundError:
+            self._size -= meta.get("size", 0)
+            del self._files[key]
+            return None
+        return body, meta["content_type"]
+
+    def _read(self, key: str) -> bytes:
+        with open(os.path.join(self._dir, key), "rb") as fh:
+            return fh.read()
+
+    def stats(self) -> dict[str, int]:
+        return {"files": len(self._files), "urls": len(self._urls), "bytes": self._size}
+
+    def _as_dict(self) -> dict[str, Any]:
+        return {"files": dict(self._files), "urls": dict(self._urls)}
+
+    async def async_flush(self) -> None:
+        if self._loaded:
+            await self._store.async_save(self._as_dict())
+
+class MotoGPImageView(HomeAssistantView):
+
+    url           = IMAGE_URL.format(key="{key}")
+    name          = f"api:{DOMAIN}:image"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+
+    async def get(self, request: web.Request, key: str) -> web.StreamResponse:
+        etag = f'"{key}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL})
+
+        for entry_data in self._hass.data.get(DOMAIN, {}).values():
+            image = await entry_data[KEY_CLIENT].images.async_read(key)
+            if image is not None:
+                body, content_type = image
+                return web.Response(
+                    body=body,
+                    content_type=content_type,
+                    headers={"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL},
+                )
+        return web.Response(status=404)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+from .const import LAP_HISTORY_DEFAULT_LAPS, LAP_HISTORY_WINDOW
+from .live_delta import lap_seconds
+from .models import LiveRow
+
+NAN = float("nan")
+
+def gap_seconds(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(str(value).strip().lstrip("+"))
+    except ValueError:
+        return NAN
+
+def _out(value: float) -> float | None:
+    return None if math.isnan(value) else round(value, 3)
+
+class _Ring:
+
+    __slots__ = ("_buf", "_start", "_len")
+
+    def __init__(self, capacity: int, typecode: str = "d") -> None:
+        self._buf   = array(typecode, [0] * capacity)
+        self._start = 0
+        self._len   = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, value) -> None:
+        cap = len(self._buf)
+        if self._len < cap:
+            self._buf[(self._start + self._len) % cap] = value
+            self._len += 1
+        else:
+            self._buf[self._start] = value
+            self._start = (self._start + 1) % cap
+
+    def __getitem__(self, i: int):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError(i)
+        return self._buf[(self._start + i) % len(self._buf)]
+
+    def tolist(self) -> list:
+        return [self[i] for i in range(self._len)]
+
+class RiderLapHistory:
+
+    __slots__ = ("laps", "times", "gaps", "best", "best_lap", "_sum", "_count")
+
+    def __init__(self, capacity: int) -> None:
+        self.laps  = _Ring(capacity, "l")
+        self.times = _Ring(capacity)
+        self.gaps  = _Ring(capacity)
+        self.best     = NAN
+        self.best_lap = 0
+        self._sum     = 0.0
+        self._count   = 0
+
+    @property
+    def last_lap(self) -> int:
+        return self.laps[-1] if len(self.laps) else 0
+
+    def append(self, lap: int, time: float, gap: float) -> None:
+        if len(self.times) >= LAP_HISTORY_WINDOW:
+            dropped = self.times[-LAP_HISTORY_WINDOW]
+            if not math.isnan(dropped):
+                self._sum   -= dropped
+                self._count -= 1
+
+        self.laps.append(lap)
+        self.times.append(time)
+        self.gaps.append(gap)
+
+        if not math.isnan(time):
+            self._sum   += time
+            self._count += 1
+            if math.isnan(self.best) or time < self.best:
+                self.best     = time
+                self.best_lap = lap
+
+    @property
+    def rolling_average(self) -> float:
+        return self._sum / self._count if self._count else NAN
+
+    @property
+    def gap_trend(self) -> float:
+        n = min(len(self.gaps), LAP_HISTORY_WINDOW)
+        if n < 2:
+            return NAN
+        return (self.gaps[-1] - self.gaps[-n]) / (n - 1)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "laps":            self.laps.tolist(),
+            "lap_times":       [_out(v) for v in self.times.tolist()],
+            "gaps":            [_out(v) for v in self.gaps.tolist()],
+            "best":            _out(self.best),
+            "best_lap":        self.best_lap or None,
+            "rolling_average": _out(self.rolling_average),
+            "gap_trend":       _out(self.gap_trend),
+        }
+
+class LapHistory:
+
+    def __init__(self) -> None:
+        self._riders: dict[str, RiderLapHistory] = {}
+        self._names:  dict[str, str] = {}
+
+    def reset(self) -> None:
+        self._riders = {}
+        self._names  = {}
+
+    def record(self, classification: Sequence[LiveRow], total_laps: int | None) -> None:
+        capacity = total_laps if isinstance(total_laps, int) and total_laps > 0 else LAP_HISTORY_DEFAULT_LAPS
+        capacity = max(capacity, LAP_HISTORY_WINDOW)
+        for row in classification:
+            lap = row.laps
+            if not isinstance(lap, int) or lap <= 0:
+                continue
+            number  = row.number
+            history = self._riders.get(number)
+            if history is None:
+                history = self._riders[number] = RiderLapHistory(capacity)
+            if lap <= history.last_lap:
+                continue
+            self._names[number] = row.name or ""
+            history.append(
+                lap,
+                lap_seconds(row.last_lap) or NAN,
+                0.0 if row.pos == 1 else gap_seconds(row.gap_first),
+            )
+
+    def as_dict(self, number: str | None = None) -> dict[str, Any]:
+        numbers = [number] if number else list(self._riders)
+        return {
+            n: {"name": self._names.get(n, ""), **self._riders[n].as_dict()}
+            for n in numbers if n in self._riders
+        }
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from .const import RETIRED_STATUSES
+from .models import LiveRow
+
+def lap_seconds(value: Any) -> float | None:
+    if value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        minutes, _, seconds = str(value).strip().replace("'", ":").rpartition(":")
+        return (int(minutes) * 60 if minutes else 0) + float(seconds)
+    except ValueError:
+        return None
+
+def _valid_pos(pos: Any) -> bool:
+    return isinstance(pos, int) and pos > 0
+
+class LiveDelta:
+
+    __slots__ = ("changed", "removed", "overtakes", "laps", "fastest_lap", "retirements", "status_changes")
+
+    def __init__(self) -> None:
+        self.changed:        list[LiveRow] = []
+        self.removed:        list[str]  = []
+        self.overtakes:      list[dict] = []
+        self.laps:           list[dict] = []
+        self.fastest_lap:    dict | None = None
+        self.retirements:    list[dict] = []
+        self.status_changes: list[dict] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.removed)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "changed":        [r.as_dict() for r in self.changed],
+            "removed":        self.removed,
+            "overtakes":      self.overtakes,
+            "laps":           self.laps,
+            "fastest_lap":    self.fastest_lap,
+            "retirements":    self.retirements,
+            "status_changes": self.status_changes,
+        }
+
+class LiveDeltaEngine:
+
+    def __init__(self) -> None:
+        self._rows: dict[str, LiveRow] = {}
+        self._best: float | None = None
+
+    def reset(self) -> None:
+        self._rows = {}
+        self._best = None
+
+    def update(self, classification: Sequence[LiveRow]) -> LiveDelta:
+        delta    = LiveDelta()
+        previous = self._rows
+        baseline = not previous
+        current  = {r.number: r for r in classification}
+
+        for number, row in current.items():
+            old = previous.get(number)
+            if old == row:
+                continue
+            delta.changed.append(row)
+            if old is None or baseline:
+                continue
+
+            if _valid_pos(row.pos) and _valid_pos(old.pos) and row.pos < old.pos:
+                delta.overtakes.append({
+                    "number": number, "name": row.name, "from": old.pos, "to": row.pos,
+                })
+
+            if isinstance(row.laps, int) and row.laps != old.laps:
+                lap = {
+                    "number": number, "name": row.name, "lap": row.laps, "lap_time": row.last_lap,
+                }
+                delta.laps.append(lap)
+                seconds = lap_seconds(row.last_lap)
+                if seconds and (self._best is None or seconds < self._best):
+                    self._best = seconds
+                    delta.fastest_lap = {**lap, "seconds": seconds}
+
+            if row.status != old.status:
+                change = {"number": number, "name": row.name, "from": old.status, "to": row.status}
+                delta.status_changes.append(change)
+                if (row.status or "").lower() in RETIRED_STATUSES:
+                    delta.retirements.append(change)
+
+        delta.removed = [n for n in previous if n not in current]
+
+        if baseline:
+            for row in classification:
+                seconds = lap_seconds(row.last_lap)
+                if seconds and (self._best is None or seconds < self._best):
+                    self._best = seconds
+
+        self._rows = current
+        return delta
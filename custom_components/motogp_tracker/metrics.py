@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .const import METRICS_LATENCY_BUCKETS, METRICS_LOOP_LAG_WARN
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_MICRO        = "micro"
+CACHE_SHARED       = "shared"
+CACHE_NOT_MODIFIED = "not_modified"
+CACHE_UNCHANGED    = "unchanged"
+
+def endpoint_key(endpoint: str) -> str:
+    key = endpoint.split("?", 1)[0]
+    if key.startswith("riders/"):
+        return "riders"
+    if key.startswith("results/session/"):
+        return "results/session"
+    return key
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+def _since(at: float | None) -> float | None:
+    return round(time.time() - at, 1) if at is not None else None
+
+class _Timing:
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max   = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max    = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count":   self.count,
+            "mean_ms": _ms(self.total / self.count) if self.count else None,
+            "max_ms":  _ms(self.max) if self.count else None,
+        }
+
+class EndpointMetrics:
+
+    __slots__ = (
+        "latency", "buckets", "parse", "offloaded", "bytes_total", "bytes_last",
+        "statuses", "errors", "cache_hits", "cache_misses", "last_success",
+    )
+
+    def __init__(self) -> None:
+        self.latency      = _Timing()
+        self.buckets      = [0] * (len(METRICS_LATENCY_BUCKETS) + 1)
+        self.parse        = _Timing()
+        self.offloaded    = 0
+        self.bytes_total  = 0
+        self.bytes_last   = 0
+        self.statuses:   dict[int, int] = {}
+        self.errors:     dict[str, int] = {}
+        self.cache_hits: dict[str, int] = {}
+        self.cache_misses = 0
+        self.last_success: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        hits  = sum(self.cache_hits.values())
+        total = hits + self.cache_misses
+        return {
+            "latency": {
+                **self.latency.as_dict(),
+                "histogram": {
+                    **{f"le_{b:g}s": n for b, n in zip(METRICS_LATENCY_BUCKETS, self.buckets)},
+                    "inf": self.buckets[-1],
+                },
+            },
+            "parse":             self.parse.as_dict(),
+            "parse_offloaded":   self.offloaded,
+            "bytes_total":       self.bytes_total,
+            "bytes_last":        self.bytes_last,
+            "statuses":          {str(k): v for k, v in sorted(self.statuses.items())},
+            "errors":            dict(self.errors),
+            "cache_hits":        dict(self.cache_hits),
+            "cache_misses":      self.cache_misses,
+            "cache_hit_ratio":   round(hits / total, 3) if total else None,
+            "since_success_s":   _since(self.last_success),
+        }
+
+class UpdateMetrics:
+
+    __slots__ = ("duration", "listeners", "failures", "changes", "last_success")
+
+    def __init__(self) -> None:
+        self.duration  = _Timing()
+        self.listeners = _Timing()
+        self.failures  = 0
+        self.changes   = 0
+        self.last_success: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "updates":         self.duration.as_dict(),
+            "listeners":       self.listeners.as_dict(),
+            "failures":        self.failures,
+            "changes":         self.changes,
+            "since_success_s": _since(self.last_success),
+        }
+
+class LoopMetrics:
+
+    __slots__ = ("duration", "stalls")
+
+    def __init__(self) -> None:
+        self.duration = _Timing()
+        self.stalls   = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {**self.duration.as_dict(), "stalls": self.stalls}
+
+class Metrics:
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._updates:   dict[str, UpdateMetrics] = {}
+        self._loop:      dict[str, LoopMetrics] = {}
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        key = endpoint_key(endpoint)
+        if (metrics := self._endpoints.get(key)) is None:
+            metrics = self._endpoints[key] = EndpointMetrics()
+        return metrics
+
+    def update(self, name: str) -> UpdateMetrics:
+        if (metrics := self._updates.get(name)) is None:
+            metrics = self._updates[name] = UpdateMetrics()
+        return metrics
+
+    def record_response(self, endpoint: str, status: int, seconds: float, size: int = 0) -> None:
+        metrics = self.endpoint(endpoint)
+        metrics.latency.add(seconds)
+        metrics.buckets[bisect_left(METRICS_LATENCY_BUCKETS, seconds)] += 1
+        metrics.statuses[status] = metrics.statuses.get(status, 0) + 1
+        if size:
+            metrics.bytes_total += size
+            metrics.bytes_last   = size
+
+    def record_parse(self, endpoint: str, seconds: float, offloaded: bool = False) -> None:
+        metrics = self.endpoint(endpoint)
+        metrics.parse.add(seconds)
+        metrics.cache_misses += 1
+        if offloaded:
+            metrics.offloaded += 1
+
+    def record_cache_hit(self, endpoint: str, kind: str) -> None:
+        hits = self.endpoint(endpoint).cache_hits
+        hits[kind] = hits.get(kind, 0) + 1
+
+    def record_error(self, endpoint: str, kind: str) -> None:
+        errors = self.endpoint(endpoint).errors
+        errors[kind] = errors.get(kind, 0) + 1
+
+    def record_success(self, endpoint: str) -> None:
+        self.endpoint(endpoint).last_success = time.time()
+
+    def record_update(self, name: str, seconds: float, success: bool, changed: bool) -> None:
+        metrics = self.update(name)
+        metrics.duration.add(seconds)
+        if not success:
+            metrics.failures += 1
+            return
+        metrics.last_success = time.time()
+        if changed:
+            metrics.changes += 1
+
+    def record_listeners(self, name: str, seconds: float) -> None:
+        self.update(name).listeners.add(seconds)
+
+    def record_step(self, step: str, seconds: float, stalled: bool) -> None:
+        if (metrics := self._loop.get(step)) is None:
+            metrics = self._loop[step] = LoopMetrics()
+        metrics.duration.add(seconds)
+        if stalled:
+            metrics.stalls += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "uptime_s":     _since(self.started),
+            "endpoints":    {k: m.as_dict() for k, m in sorted(self._endpoints.items())},
+            "coordinators": {k: m.as_dict() for k, m in sorted(self._updates.items())},
+            "loop":         {k: m.as_dict() for k, m in sorted(self._loop.items())},
+        }
+
+@contextmanager
+def loop_guard(step: str, metrics: Metrics | None = None) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        stalled = elapsed >= METRICS_LOOP_LAG_WARN
+        if metrics is not None:
+            metrics.record_step(step, elapsed, stalled)
+        if stalled:
+            _LOGGER.warning(
+                "[MotoGP] Etape %s : boucle d'evenements bloquee %.0f ms (seuil %.0f ms)",
+                step, elapsed * 1000, METRICS_LOOP_LAG_WARN * 1000,
+            )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+class _Record:
+
+    __slots__ = ()
+
+    _fields: tuple[str, ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self._fields}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]):
+        return cls(**{name: data.get(name) for name in cls._fields})
+
+def _record(cls):
+    cls = dataclass(frozen=True, slots=True)(cls)
+    cls._fields = tuple(f.name for f in fields(cls))
+    return cls
+
+@_record
+class RiderStanding(_Record):
+    position:        int | None
+    full_name:       str
+    number:          str
+    country_iso:     str
+    country_name:    str
+    team:            str
+    points:          int
+    wins:            int
+    podiums:         int
+    sprint_wins:     int
+    sprint_podiums:  int
+    riders_api_uuid: str
+
+@_record
+class TeamStanding(_Record):
+    position: int
+    name:     str
+    points:   int
+
+@_record
+class SessionRow(_Record):
+    id:          str
+    type:        str
+    start_utc:   str
+    start_local: str
+    status:      str
+
+@_record
+class LiveRow(_Record):
+    pos:       int | None
+    number:    str
+    name:      str
+    nation:    str
+    team:      str
+    bike:      str
+    laps:      int | None
+    gap_first: Any
+    last_lap:  str
+    status:    str
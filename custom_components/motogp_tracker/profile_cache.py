@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    PROFILE_CACHE_MAX,
+    PROFILE_CACHE_SAVE_DELAY,
+    PROFILE_CACHE_TTL,
+    STORAGE_KEY_PROFILES,
+    STORAGE_VERSION,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+def project_profile(raw: dict) -> dict[str, Any]:
+    photo_url = ""
+    for step in raw.get("career") or []:
+        if step.get("current"):
+            photo_url = (step.get("pictures") or {}).get("profile", {}).get("main") or ""
+            break
+
+    country = raw.get("country") or {}
+    phys    = raw.get("physical_attributes") or {}
+    return {
+        "photo_url":    photo_url,
+        "age":          raw.get("years_old"),
+        "birth_city":   raw.get("birth_city", ""),
+        "height":       phys.get("height"),
+        "weight":       phys.get("weight"),
+        "country_iso":  (country.get("iso") or "").lower(),
+        "country_name": country.get("name", ""),
+        "country_flag": country.get("flag", ""),
+    }
+
+class ProfileCache:
+
+    def __init__(self, hass: HomeAssistant, key: str = STORAGE_KEY_PROFILES) -> None:
+        self._store: Store[dict] = Store(hass, STORAGE_VERSION, key)
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        stored = await self._store.async_load()
+        for uuid, entry in ((stored or {}).get("profiles") or {}).items():
+            self._entries[uuid] = entry
+        self._evict()
+        _LOGGER.debug("[MotoGP Rider] %d profils restaures", len(self._entries))
+
+    def get(self, uuid: str) -> dict[str, Any] | None:
+        entry = self._entries.get(uuid)
+        if entry is None:
+            return None
+        if time.time() - entry["fetched_at"] > PROFILE_CACHE_TTL.total_seconds():
+            return None
+        self._entries.move_to_end(uuid)
+        return entry["profile"]
+
+    def put(self, uuid: str, profile: dict[str, Any]) -> None:
+        self._entries.pop(uuid, None)
+        self._entries[uuid] = {"fetched_at": time.time(), "profile": profile}
+        self._evict()
+        self._store.async_delay_save(self._as_dict, PROFILE_CACHE_SAVE_DELAY)
+
+    def _evict(self) -> None:
+        while len(self._entries) > PROFILE_CACHE_MAX:
+            self._entries.popitem(last=False)
+
+    def _as_dict(self) -> dict[str, Any]:
+        return {"profiles": dict(self._entries)}
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from .const import (
+    API_BACKOFF_BASE,
+    API_BACKOFF_MAX,
+    API_BREAKER_THRESHOLD,
+    API_RATE_BURST,
+    API_RATE_PER_SECOND,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+BREAKER_CLOSED    = "closed"
+BREAKER_OPEN      = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+class CircuitOpenError(Exception):
+
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(f"API suspendue pour {key} ({retry_in:.0f} s)")
+        self.key      = key
+        self.retry_in = retry_in
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class CircuitBreaker:
+
+    def __init__(self, key: str) -> None:
+        self.key       = key
+        self.state     = BREAKER_CLOSED
+        self.failures  = 0
+        self._open_until = 0.0
+        self._probing    = False
+
+    def before_request(self) -> None:
+        if self.state == BREAKER_CLOSED:
+            return
+        now = time.monotonic()
+        if self.state == BREAKER_OPEN:
+            if now < self._open_until:
+                raise CircuitOpenError(self.key, self._open_until - now)
+            self.state = BREAKER_HALF_OPEN
+            self._probing = False
+        if self._probing:
+            raise CircuitOpenError(self.key, 0)
+        self._probing = True
+        _LOGGER.debug("[MotoGP API] Sonde semi-ouverte %s", self.key)
+
+    def abort_probe(self) -> None:
+        self._probing = False
+
+    def record_success(self) -> None:
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("[MotoGP API] API retablie pour %s", self.key)
+        self.state    = BREAKER_CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self, retry_after: float | None = None) -> None:
+        self.failures += 1
+        self._probing  = False
+        if retry_after is None and self.state == BREAKER_CLOSED and self.failures < API_BREAKER_THRESHOLD:
+            return
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            exp   = max(0, self.failures - API_BREAKER_THRESHOLD)
+            delay = min(API_BACKOFF_MAX, API_BACKOFF_BASE * 2 ** exp) * random.uniform(0.5, 1.0)
+
+        if self.state == BREAKER_CLOSED:
+            _LOGGER.warning("[MotoGP API] API degradee pour %s, pause de %.0f s", self.key, delay)
+        else:
+            _LOGGER.debug("[MotoGP API] %s toujours indisponible, pause de %.0f s", self.key, delay)
+        self.state       = BREAKER_OPEN
+        self._open_until = time.monotonic() + delay
+
+    def as_dict(self) -> dict:
+        return {
+            "state":    self.state,
+            "failures": self.failures,
+            "retry_in": round(max(0.0, self._open_until - time.monotonic()), 1)
+            if self.state == BREAKER_OPEN else 0,
+        }
+
+class TokenBucket:
+
+    def __init__(
+        self, rate: float = API_RATE_PER_SECOND, capacity: float = API_RATE_BURST
+    ) -> None:
+        self._rate     = rate
+        self._capacity = capacity
+        self._tokens   = capacity
+        self._updated  = time.monotonic()
+        self._lock     = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens  = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
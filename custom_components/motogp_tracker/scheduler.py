@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    EVENT_BOUNDARY_DELAY,
+    INTERVAL_LIVE,
+    INTERVAL_LIVE_DORMANT,
+    INTERVAL_LIVE_FAST,
+    INTERVAL_LIVE_MIN,
+    INTERVAL_LIVE_WARMUP,
+    LIVE_COOLDOWN,
+    LIVE_PHASE_COOLDOWN,
+    LIVE_PHASE_DORMANT,
+    LIVE_PHASE_LIVE,
+    LIVE_PHASE_WARMUP,
+    LIVE_WARMUP,
+    SESSION_DURATION_DEFAULT,
+    SESSION_DURATIONS,
+)
+from .models import SessionRow
+
+class LiveSchedule(NamedTuple):
+    phase:    str
+    session:  SessionRow | None
+    interval: timedelta
+
+def parse_utc(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        dt = dt_util.parse_datetime(value)
+    except ValueError:
+        return None
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=dt_util.UTC)
+    return dt
+
+def session_window(session: SessionRow) -> tuple[datetime, datetime] | None:
+    start = parse_utc(session.start_utc)
+    if start is None:
+        return None
+    return start, start + SESSION_DURATIONS.get(session.type, SESSION_DURATION_DEFAULT)
+
+def live_schedule(
+    sessions: Sequence[SessionRow],
+    now: datetime,
+    live_id: str | None = None,
+    finished: dict[str, datetime] | None = None,
+) -> LiveSchedule:
+    finished = finished or {}
+
+    for session in sessions:
+        window = session_window(session)
+        if window is None:
+            continue
+        start, end = window
+        sid = session.id
+
+        if sid and sid == live_id:
+            return LiveSchedule(LIVE_PHASE_LIVE, session, INTERVAL_LIVE_FAST)
+
+        end = finished.get(sid, end)
+        if now < start - LIVE_WARMUP:
+            wait = start - LIVE_WARMUP - now
+            return LiveSchedule(
+                LIVE_PHASE_DORMANT, session, max(INTERVAL_LIVE_MIN, min(wait, INTERVAL_LIVE_DORMANT))
+            )
+        if now < start:
+            return LiveSchedule(LIVE_PHASE_WARMUP, session, INTERVAL_LIVE_WARMUP)
+        if now < end and sid not in finished:
+            return LiveSchedule(LIVE_PHASE_LIVE, session, INTERVAL_LIVE_FAST)
+        if now < end + LIVE_COOLDOWN:
+            return LiveSchedule(LIVE_PHASE_COOLDOWN, session, INTERVAL_LIVE)
+
+    return LiveSchedule(LIVE_PHASE_DORMANT, None, INTERVAL_LIVE_DORMANT)
+
+def next_boundary(
+    event: dict | None, sessions: Sequence[SessionRow], now: datetime
+) -> datetime | None:
+    points: list[datetime] = []
+    for session in sessions:
+        window = session_window(session)
+        if window is not None:
+            points.extend(window)
+    if event:
+        for key in ("date_start", "date_end"):
+            if (dt := parse_utc(event.get(key))) is not None:
+                points.append(dt)
+
+    upcoming = [p + EVENT_BOUNDARY_DELAY for p in points if p + EVENT_BOUNDARY_DELAY > now]
+    return min(upcoming) if upcoming else None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+from .const import CIRCUIT_SLUGS, INDEX_REVALIDATE
+from .scheduler import parse_utc
+
+_LOGGER = logging.getLogger(__name__)
+
+class SeasonIndex:
+
+    def __init__(self, season_id: str, entries: list[dict], fetched_at: datetime) -> None:
+        self.season_id  = season_id
+        self.fetched_at = fetched_at
+        self.entries    = entries
+
+        self._rows: list[tuple[datetime, datetime, dict]] = []
+        for e in entries:
+            start = parse_utc(e.get("date_start"))
+            if start is None:
+                continue
+            end = parse_utc(e.get("date_end")) or start
+            self._rows.append((start, end, e))
+        self._rows.sort(key=lambda row: row[0])
+        self._starts = [row[0] for row in self._rows]
+        self._current = next((row for row in self._rows if row[2].get("status") == "CURRENT"), None)
+
+    @classmethod
+    def from_events(cls, season_id: str, events: list[dict]) -> SeasonIndex:
+        entries: list[dict] = []
+        for e in events:
+            if e.get("test", False):
+                continue
+            circuit = e.get("circuit") or {}
+            country = e.get("country") or {}
+            cname   = (circuit.get("name") or circuit.get("place") or "").strip()
+            slug    = CIRCUIT_SLUGS.get(cname.lower(), "")
+            if not slug:
+                _LOGGER.warning("[MotoGP Event] Slug inconnu pour '%s'", cname)
+            entries.append({
+                "uuid":         str(e.get("id") or e.get("uuid") or ""),
+                "name":         e.get("name", ""),
+                "status":       (e.get("status") or "").upper(),
+                "date_start":   e.get("date_start", ""),
+                "date_end":     e.get("date_end", ""),
+                "country_name": country.get("name", ""),
+                "country_iso":  (country.get("iso", "") or "").lower(),
+                "circuit_name": cname,
+                "circuit_slug": slug,
+            })
+        return cls(season_id, entries, dt_util.utcnow())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SeasonIndex | None:
+        fetched_at = parse_utc(data.get("fetched_at"))
+        if not data.get("season_id") or fetched_at is None:
+            return None
+        return cls(data["season_id"], data.get("entries") or [], fetched_at)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "season_id":  self.season_id,
+            "fetched_at": self.fetched_at.isoformat(),
+            "entries":    self.entries,
+        }
+
+    def is_stale(self, now: datetime) -> bool:
+        return now - self.fetched_at >= INDEX_REVALIDATE
+
+    def pick(self, now: datetime) -> dict | None:
+        if self._current is not None and now <= self._current[1] + INDEX_REVALIDATE:
+            return self._current[2]
+
+        i = bisect_right(self._starts, now)
+        if i > 0 and now <= self._rows[i - 1][1]:
+            return self._rows[i - 1][2]
+        return self._rows[i][2] if i < len(self._rows) else None
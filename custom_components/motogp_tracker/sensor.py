@@ -3,44 +3,147 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import COORD_EVENT, COORD_LIVE, COORD_STANDINGS, DOMAIN, KEY_COORDINATORS
+from .const import (
+    CONF_ATTRIBUTE_MAX_ROWS,
+    CONF_RIDER_ENTITIES,
+    COORD_EVENT,
+    COORD_LIVE,
+    COORD_STANDINGS,
+    DEFAULT_ATTRIBUTE_MAX_ROWS,
+    DEFAULT_RIDER_ENTITIES,
+    DOMAIN,
+    KEY_CLIENT,
+    KEY_COORDINATORS,
+    LIVE_PHASE_DORMANT,
+    METRICS_SCAN_INTERVAL,
+)
+from .api import MotoGPApiClient
 from .coordinator import (
     MotoGPEventCoordinator,
     MotoGPLiveTimingCoordinator,
     MotoGPStandingsCoordinator,
 )
+from .models import LiveRow, SessionRow
 
 _LOGGER = logging.getLogger(__name__)
 
+RIDER_UNIQUE_ID_PREFIX = "motogp_live_rider_"
+
+SCAN_INTERVAL = METRICS_SCAN_INTERVAL
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coords = hass.data[DOMAIN][entry.entry_id][KEY_COORDINATORS]
+    coords   = hass.data[DOMAIN][entry.entry_id][KEY_COORDINATORS]
+    client   = hass.data[DOMAIN][entry.entry_id][KEY_CLIENT]
+    max_rows = entry.options.get(CONF_ATTRIBUTE_MAX_ROWS, DEFAULT_ATTRIBUTE_MAX_ROWS)
 
     async_add_entities([
         MotoGPNextEventSensor(coords[COORD_EVENT]),
         MotoGPNextRaceStartSensor(coords[COORD_EVENT]),
-        MotoGPSessionsSensor(coords[COORD_EVENT]),
-        MotoGPRiderStandingsSensor(coords[COORD_STANDINGS]),
-        MotoGPTeamStandingsSensor(coords[COORD_STANDINGS]),
-        MotoGPLiveTimingSensor(coords[COORD_LIVE]),
+        MotoGPSessionsSensor(coords[COORD_EVENT], max_rows),
+        MotoGPRiderStandingsSensor(coords[COORD_STANDINGS], max_rows),
+        MotoGPTeamStandingsSensor(coords[COORD_STANDINGS], max_rows),
+        MotoGPLiveTimingSensor(coords[COORD_LIVE], max_rows),
+        MotoGPApiDiagnosticSensor(client),
+        *(MotoGPUpdateDiagnosticSensor(client, key, coord) for key, coord in coords.items()),
     ])
 
+    _purge_rider_entities(hass, entry)
+    if entry.options.get(CONF_RIDER_ENTITIES, DEFAULT_RIDER_ENTITIES):
+        manager = _LiveRiderManager(hass, coords[COORD_LIVE], async_add_entities)
+        entry.async_on_unload(coords[COORD_LIVE].async_add_listener(manager.async_update))
+        entry.async_on_unload(manager.async_clear)
+
+@callback
+def _purge_rider_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    registry = er.async_get(hass)
+    for reg in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (reg.unique_id or "").startswith(RIDER_UNIQUE_ID_PREFIX):
+            registry.async_remove(reg.entity_id)
+
+class _LiveRiderManager:
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: MotoGPLiveTimingCoordinator,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        self._hass        = hass
+        self._coordinator = coordinator
+        self._add         = async_add_entities
+        self._entities: dict[str, MotoGPLiveRiderSensor] = {}
+
+    @callback
+    def async_update(self) -> None:
+        data = self._coordinator.data or {}
+        rows = {r.number: r for r in data.get("classification", ())}
+
+        if not rows or data.get("phase") == LIVE_PHASE_DORMANT:
+            self.async_clear()
+            return
+
+        changed = {r.number for r in self._coordinator.last_delta.changed}
+        new: list[MotoGPLiveRiderSensor] = []
+        for number, row in rows.items():
+            entity = self._entities.get(number)
+            if entity is None:
+                entity = self._entities[number] = MotoGPLiveRiderSensor(row)
+                new.append(entity)
+            elif number in changed:
+                entity.async_set_row(row)
+
+        for number in [n for n in self._entities if n not in rows]:
+            self._remove(self._entities.pop(number))
+
+        if new:
+            _LOGGER.debug("[MotoGP Live] %d capteurs pilote crees", len(new))
+            self._add(new)
+
+    @callback
+    def async_clear(self) -> None:
+        if not self._entities:
+            return
+        _LOGGER.debug("[MotoGP Live] Suppression de %d capteurs pilote", len(self._entities))
+        for entity in self._entities.values():
+            self._remove(entity)
+        self._entities = {}
+
+    @callback
+    def _remove(self, entity: MotoGPLiveRiderSensor) -> None:
+        registry = er.async_get(self._hass)
+        if entity.entity_id and registry.async_get(entity.entity_id):
+            registry.async_remove(entity.entity_id)
+        elif entity.hass is not None:
+            self._hass.async_create_task(entity.async_remove(force_remove=True))
+
 class _MotoGPSensor(CoordinatorEntity, SensorEntity):
 
     _attr_should_poll = False
 
-    def __init__(self, coordinator: CoordinatorEntity, unique_id: str) -> None:
+    def __init__(self, coordinator: CoordinatorEntity, unique_id: str, max_rows: int = 0) -> None:
         super().__init__(coordinator)
         self._attr_unique_id = unique_id
+        self._max_rows = max_rows
+
+    def _limit(self, rows: list) -> list:
+        return rows[:self._max_rows] if self._max_rows else rows
+
+    @property
+    def _last_changed(self) -> str | None:
+        changed = self.coordinator.last_changed
+        return changed.isoformat() if changed else None
 
     @property
     def available(self) -> bool:
@@ -73,7 +176,7 @@ class MotoGPNextEventSensor(_MotoGPSensor):
             "date_end_local":   event["date_end_local"],
             "country_name":     event["country_name"],
             "country_iso":      event["country_iso"],
-            "flag_url":         event["flag_url"],
+            "flag_url":         self.coordinator.image_url(event["flag_url"]),
             "circuit_name":     event["circuit_name"],
             "circuit_slug":     event["circuit_slug"],
             "circuit_svg":      event["circuit_svg"],
@@ -87,21 +190,21 @@ class MotoGPNextRaceStartSensor(_MotoGPSensor):
     def __init__(self, coordinator: MotoGPEventCoordinator) -> None:
         super().__init__(coordinator, "motogp_next_race_start")
 
-    def _race_session(self) -> dict | None:
-        sessions = (self.coordinator.data or {}).get("sessions", [])
-        return next((s for s in sessions if s["type"] == "RAC"), None)
+    def _race_session(self) -> SessionRow | None:
+        sessions = (self.coordinator.data or {}).get("sessions", ())
+        return next((s for s in sessions if s.type == "RAC"), None)
 
     @property
     def native_value(self) -> str | None:
         race = self._race_session()
-        return race["start_local"] if race else None
+        return race.start_local if race else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         race = self._race_session()
         return {
-            "start_utc":      race["start_utc"] if race else None,
-            "session_status": race["status"] if race else None,
+            "start_utc":      race.start_utc if race else None,
+            "session_status": race.status if race else None,
             "race_uuid":      (self.coordinator.data or {}).get("race_uuid"),
         }
 
@@ -109,77 +212,81 @@ class MotoGPSessionsSensor(_MotoGPSensor):
 
     _attr_name = "MotoGP Sessions"
     _attr_icon = "mdi:timer-sand"
+    _unrecorded_attributes = frozenset({"sessions"})
 
-    def __init__(self, coordinator: MotoGPEventCoordinator) -> None:
-        super().__init__(coordinator, "motogp_sessions")
+    def __init__(self, coordinator: MotoGPEventCoordinator, max_rows: int = 0) -> None:
+        super().__init__(coordinator, "motogp_sessions", max_rows)
 
     @property
     def native_value(self) -> str:
-        sessions = (self.coordinator.data or {}).get("sessions", [])
+        sessions = (self.coordinator.data or {}).get("sessions", ())
         return f"{len(sessions)} sessions" if sessions else "no_data"
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         data = self.coordinator.data or {}
         return {
-            "race_uuid": data.get("race_uuid"),
-            "sessions":  data.get("sessions", []),
-
+            "race_uuid":    data.get("race_uuid"),
+            "sessions":     self._limit(self.coordinator.view("sessions")),
+            "last_changed": self._last_changed,
         }
 
 class MotoGPRiderStandingsSensor(_MotoGPSensor):
 
     _attr_name = "MotoGP Classement Pilotes"
     _attr_icon = "mdi:trophy"
+    _unrecorded_attributes = frozenset({"standings"})
 
-    def __init__(self, coordinator: MotoGPStandingsCoordinator) -> None:
-        super().__init__(coordinator, "motogp_rider_standings")
+    def __init__(self, coordinator: MotoGPStandingsCoordinator, max_rows: int = 0) -> None:
+        super().__init__(coordinator, "motogp_rider_standings", max_rows)
 
     @property
     def native_value(self) -> str | None:
-        riders = (self.coordinator.data or {}).get("riders", [])
-        return riders[0]["full_name"] if riders else None
+        riders = (self.coordinator.data or {}).get("riders", ())
+        return riders[0].full_name if riders else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         data = self.coordinator.data or {}
         return {
-            "season_year": data.get("season_year"),
-            "count":       len(data.get("riders", [])),
-            "standings":   data.get("riders", []),
-
+            "season_year":  data.get("season_year"),
+            "count":        len(data.get("riders", ())),
+            "standings":    self._limit(self.coordinator.view("riders")),
+            "last_changed": self._last_changed,
         }
 
 class MotoGPTeamStandingsSensor(_MotoGPSensor):
 
     _attr_name = "MotoGP Classement Équipes"
     _attr_icon = "mdi:racing-helmet"
+    _unrecorded_attributes = frozenset({"standings"})
 
-    def __init__(self, coordinator: MotoGPStandingsCoordinator) -> None:
-        super().__init__(coordinator, "motogp_team_standings")
+    def __init__(self, coordinator: MotoGPStandingsCoordinator, max_rows: int = 0) -> None:
+        super().__init__(coordinator, "motogp_team_standings", max_rows)
 
     @property
     def native_value(self) -> str | None:
-        teams = (self.coordinator.data or {}).get("teams", [])
-        return teams[0]["name"] if teams else None
+        teams = (self.coordinator.data or {}).get("teams", ())
+        return teams[0].name if teams else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         data = self.coordinator.data or {}
         return {
-            "season_year": data.get("season_year"),
-            "count":       len(data.get("teams", [])),
-            "standings":   data.get("teams", []),
-
+            "season_year":  data.get("season_year"),
+            "count":        len(data.get("teams", ())),
+            "standings":    self._limit(self.coordinator.view("teams")),
+            "last_changed": self._last_changed,
         }
 
 class MotoGPLiveTimingSensor(_MotoGPSensor):
 
     _attr_name = "MotoGP Live Timing"
     _attr_icon = "mdi:speedometer"
+    _unrecorded_attributes = frozenset({"classification"})
 
-    def __init__(self, coordinator: MotoGPLiveTimingCoordinator) -> None:
-        super().__init__(coordinator, "motogp_live_timing")
+    def __init__(self, coordinator: MotoGPLiveTimingCoordinator, max_rows: int = 0) -> None:
+        super().__init__(coordinator, "motogp_live_timing", max_rows)
 
     @property
     def native_value(self) -> str:
@@ -190,9 +297,100 @@ class MotoGPLiveTimingSensor(_MotoGPSensor):
         data = self.coordinator.data or {}
         return {
             "active":         data.get("active", False),
+            "phase":          data.get("phase"),
+            "api_status":     self.coordinator.api_status,
             "total_laps":     data.get("total_laps"),
             "current_lap":    data.get("current_lap"),
             "race_uuid":      data.get("race_uuid"),
-            "classification": data.get("classification", []),
+            "session_uuid":   data.get("session_uuid"),
+            "session_type":   data.get("session_type"),
+            "classification": self._limit(self.coordinator.view("classification")),
+            "last_changed":   self._last_changed,
+        }
 
+class MotoGPLiveRiderSensor(SensorEntity):
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:motorbike"
+
+    def __init__(self, row: LiveRow) -> None:
+        self._row = row
+        self._attr_unique_id = f"{RIDER_UNIQUE_ID_PREFIX}{row.number}"
+        self._attr_name      = f"MotoGP Live #{row.number}"
+
+    @callback
+    def async_set_row(self, row: LiveRow) -> None:
+        self._row = row
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int | None:
+        pos = self._row.pos
+        return pos if isinstance(pos, int) and pos > 0 else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        row = self._row
+        return {
+            "number":    row.number,
+            "rider":     row.name,
+            "team":      row.team,
+            "laps":      row.laps,
+            "gap_first": row.gap_first,
+            "last_lap":  row.last_lap,
+            "status":    row.status,
         }
+
+class _MotoGPDiagnosticSensor(SensorEntity):
+
+    _attr_should_poll = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, client: MotoGPApiClient, unique_id: str) -> None:
+        self._client = client
+        self._attr_unique_id = unique_id
+
+class MotoGPApiDiagnosticSensor(_MotoGPDiagnosticSensor):
+
+    _attr_name = "MotoGP API"
+    _attr_icon = "mdi:api"
+    _unrecorded_attributes = frozenset({"endpoints", "breakers"})
+
+    def __init__(self, client: MotoGPApiClient) -> None:
+        super().__init__(client, "motogp_diag_api")
+
+    @property
+    def native_value(self) -> str:
+        return self._client.api_status
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        metrics = self._client.metrics.as_dict()
+        return {
+            "uptime_s":   metrics["uptime_s"],
+            "http_cache": self._client.cache_stats(),
+            "breakers":   self._client.breaker_states(),
+            "endpoints":  metrics["endpoints"],
+        }
+
+class MotoGPUpdateDiagnosticSensor(_MotoGPDiagnosticSensor):
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, client: MotoGPApiClient, key: str, coordinator) -> None:
+        super().__init__(client, f"motogp_diag_update_{key}")
+        self._attr_name = f"MotoGP Mise à jour {key}"
+        self._metrics   = client.metrics.update(coordinator.name)
+
+    @property
+    def native_value(self) -> float | None:
+        return self._metrics.duration.as_dict()["mean_ms"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self._metrics.as_dict()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import COORD_EVENT, COORD_LIVE, COORD_STANDINGS, DOMAIN, KEY_COORDINATORS
+
+LIVE_HEADER = (
+    "active", "session_status", "phase", "total_laps", "current_lap",
+    "race_uuid", "session_uuid", "session_type",
+)
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_subscribe_live)
+    websocket_api.async_register_command(hass, ws_subscribe_standings)
+    websocket_api.async_register_command(hass, ws_subscribe_sessions)
+
+def _coordinator(hass: HomeAssistant, key: str) -> Any | None:
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        return entry_data[KEY_COORDINATORS][key]
+    return None
+
+@callback
+def _subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+    key: str,
+    snapshot,
+    update,
+) -> None:
+    coord = _coordinator(hass, key)
+    if coord is None:
+        connection.send_error(msg["id"], "not_loaded", "MotoGP Tracker n'est pas charge")
+        return
+
+    @callback
+    def _forward() -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], update(coord)))
+
+    connection.subscriptions[msg["id"]] = coord.async_add_listener(_forward)
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"type": "snapshot", **snapshot(coord)})
+    )
+
+def _live_snapshot(coord) -> dict:
+    return dict(coord.as_jsonable())
+
+def _live_delta(coord) -> dict:
+    data  = coord.data or {}
+    delta = coord.last_delta
+    return {
+        "type":    "delta",
+        **{k: data.get(k) for k in LIVE_HEADER},
+        "changed": [r.as_dict() for r in delta.changed],
+        "removed": delta.removed,
+    }
+
+def _standings_snapshot(coord) -> dict:
+    data = coord.data or {}
+    return {
+        "season_year": data.get("season_year"),
+        "riders":      coord.view("riders"),
+        "teams":       coord.view("teams"),
+    }
+
+def _sessions_snapshot(coord) -> dict:
+    data = coord.data or {}
+    return {
+        "race_uuid": data.get("race_uuid"),
+        "sessions":  coord.view("sessions"),
+    }
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/live/subscribe"})
+@callback
+def ws_subscribe_live(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    sent: dict[str, Any] = {}
+
+    def _snapshot(coord) -> dict:
+        sent["session_uuid"] = (coord.data or {}).get("session_uuid")
+        return _live_snapshot(coord)
+
+    def _update(coord) -> dict:
+        data = coord.data or {}
+        if data.get("session_uuid") != sent.get("session_uuid") or not data.get("classification"):
+            return {"type": "snapshot", **_snapshot(coord)}
+        return _live_delta(coord)
+
+    _subscribe(hass, connection, msg, COORD_LIVE, _snapshot, _update)
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/standings/subscribe"})
+@callback
+def ws_subscribe_standings(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    _subscribe(
+        hass, connection, msg, COORD_STANDINGS,
+        _standings_snapshot, lambda c: {"type": "snapshot", **_standings_snapshot(c)},
+    )
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/sessions/subscribe"})
+@callback
+def ws_subscribe_sessions(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    _subscribe(
+        hass, connection, msg, COORD_EVENT,
+        _sessions_snapshot, lambda c: {"type": "snapshot", **_sessions_snapshot(c)},
+    )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+ROOT      = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DECODE_PY = os.path.join(ROOT, "custom_components", "motogp_tracker", "decode.py")
+FIXTURES  = os.path.join(ROOT, "scripts", "fixtures")
+LIVE      = "timing-gateway/livetiming-lite?sessionUuid=replay"
+
+def _load_decode() -> Any:
+    spec   = importlib.util.spec_from_file_location("motogp_decode", DECODE_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def load_cases() -> list[tuple[str, bytes]]:
+    cases: list[tuple[str, bytes]] = []
+    root = os.path.join(FIXTURES, "pulselive")
+    for directory, _, files in os.walk(root):
+        for name in sorted(files):
+            path  = os.path.relpath(directory, root).replace(os.sep, "/")
+            query = name[:-len(".json")]
+            with open(os.path.join(directory, name), "rb") as fh:
+                cases.append((path if query == "_" else f"{path}?{query}", fh.read()))
+
+    replays = os.path.join(FIXTURES, "replays")
+    for name in sorted(os.listdir(replays)):
+        with open(os.path.join(replays, name), encoding="utf-8") as fh:
+            next(fh)
+            for line in fh:
+                cases.append((LIVE, json.dumps(json.loads(line)["body"]).encode()))
+    return cases
+
+def bench(cases: list[tuple[str, bytes]], fn: Callable[[str, bytes], Any], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for endpoint, body in cases:
+            fn(endpoint, body)
+    return (time.perf_counter() - started) / rounds / len(cases) * 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare payload decoders on the bundled fixtures")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    decode = _load_decode()
+    cases  = load_cases()
+    print(f"{len(cases)} payloads, {sum(len(b) for _, b in cases)} bytes, {args.rounds} rounds")
+    print(f"decoder: {decode.json_loads.__module__}")
+    for label, fn in (
+        ("json.loads",          lambda e, b: json.loads(b)),
+        ("json_loads",          lambda e, b: decode.json_loads(b)),
+        ("decode (+ project)",  decode.decode),
+    ):
+        print(f"{label:<20} {bench(cases, fn, args.rounds):8.1f} us/payload")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import sys
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+
+_LOGGER = logging.getLogger("pulselive_standin")
+
+UPSTREAM_URL  = "https://api.motogp.pulselive.com/motogp/v1"
+API_PREFIX    = "/motogp/v1"
+LIVE_ENDPOINT = "timing-gateway/livetiming-lite"
+CATEGORY_NAME = "MotoGP™"
+FIXTURES_DIR  = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pulselive")
+DEFAULT_INDEX = "_"
+
+def fixture_path(root: str, path: str, query: dict[str, str]) -> str:
+    name = "&".join(f"{k}={v}" for k, v in sorted(query.items())) or DEFAULT_INDEX
+    return os.path.join(root, *path.strip("/").split("/"), f"{name}.json")
+
+def split_endpoint(endpoint: str) -> tuple[str, dict[str, str]]:
+    path, _, qs = endpoint.partition("?")
+    query = dict(part.split("=", 1) for part in qs.split("&") if "=" in part)
+    return path, query
+
+def parse_iso(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+def shift_iso(value: str | None, offset: timedelta) -> str | None:
+    dt = parse_iso(value)
+    if dt is None:
+        return value
+    return (dt + offset).isoformat()
+
+class Replay:
+
+    def __init__(self, path: str, speed: float, step: bool, lead: float) -> None:
+        with open(path, encoding="utf-8") as fh:
+            lines = [json.loads(line) for line in fh if line.strip()]
+        if not lines or "session_uuid" not in lines[0]:
+            raise ValueError(f"{path} : en-tete de rejeu manquant")
+
+        header = lines[0]
+        self.session_uuid = header["session_uuid"]
+        self.event_uuid   = header.get("event_uuid")
+        self.frames: list[dict] = lines[1:]
+        self.times  = [float(f["t"]) for f in self.frames]
+        self.speed  = speed
+        self.step   = step
+        self.anchor = datetime.now(timezone.utc) + timedelta(seconds=lead)
+        self.offset = timedelta(0)
+        if (recorded := parse_iso(header.get("session_date"))) is not None:
+            self.offset = self.anchor - recorded
+        self._cursor = -1
+        if not self.frames:
+            raise ValueError(f"{path} : aucune trame")
+
+    def restart(self, lead: float) -> None:
+        anchor       = datetime.now(timezone.utc) + timedelta(seconds=lead)
+        self.offset += anchor - self.anchor
+        self.anchor  = anchor
+        self._cursor = -1
+
+    def elapsed(self) -> float:
+        return (datetime.now(timezone.utc) - self.anchor).total_seconds() * self.speed
+
+    def frame(self) -> tuple[int, dict] | None:
+        if self.elapsed() < 0:
+            return None
+        if self.step:
+            self._cursor = min(self._cursor + 1, len(self.frames) - 1)
+            index = self._cursor
+        else:
+            index = max(bisect_right(self.times, self.elapsed()) - 1, 0)
+        return index, self.frames[index]["body"]
+
+    def rewrite(self, path: str, query: dict[str, str], data: Any) -> Any:
+        if path == "results/events" and isinstance(data, list):
+            for e in data:
+                if str(e.get("id") or e.get("uuid") or "") == self.event_uuid:
+                    e["date_start"] = shift_iso(e.get("date_start"), self.offset)
+                    e["date_end"]   = shift_iso(e.get("date_end"), self.offset)
+                    e["status"]     = "CURRENT"
+        elif path == "results/sessions" and query.get("eventUuid") == self.event_uuid and isinstance(data, list):
+            for s in data:
+                s["date"] = shift_iso(s.get("date"), self.offset)
+        return data
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "session_uuid": self.session_uuid,
+            "event_uuid":   self.event_uuid,
+            "anchor":       self.anchor.isoformat(),
+            "elapsed_s":    round(self.elapsed(), 1),
+            "speed":        self.speed,
+            "step":         self.step,
+            "cursor":       self._cursor,
+            "frames":       len(self.frames),
+        }
+
+class StandIn:
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self._root   = args.fixtures
+        self._lead   = args.lead
+        self._delay  = args.latency / 1000
+        self._errors = args.error_rate
+        self._replay = Replay(args.replay, args.speed, args.step, args.lead) if args.replay else None
+        self._hits: dict[str, int] = {}
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get(f"{API_PREFIX}/{{tail:.*}}", self.handle)
+        app.router.add_get("/_standin/status", self.handle_status)
+        app.router.add_post("/_standin/restart", self.handle_restart)
+        return app
+
+    def _load(self, path: str, query: dict[str, str]) -> Any:
+        for candidate in (fixture_path(self._root, path, query), fixture_path(self._root, path, {})):
+            if os.path.exists(candidate):
+                with open(candidate, encoding="utf-8") as fh:
+                    return json.load(fh)
+        return None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        path  = request.match_info["tail"].strip("/")
+        query = dict(request.query)
+        self._hits[path] = self._hits.get(path, 0) + 1
+
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        if self._errors and random.random() < self._errors:
+            _LOGGER.info("[MotoGP Stand-in] 503 injecte %s", path)
+            return web.Response(status=503, headers={"Retry-After": "5"})
+
+        replay = self._replay
+        if path == LIVE_ENDPOINT and replay is not None and query.get("sessionUuid") == replay.session_uuid:
+            if (frame := replay.frame()) is None:
+                _LOGGER.debug("[MotoGP Stand-in] Session pas encore demarree")
+                return web.Response(status=404)
+            index, data = frame
+            _LOGGER.info("[MotoGP Stand-in] Trame %d/%d", index + 1, len(replay.frames))
+        else:
+            data = self._load(path, query)
+            if data is None:
+                _LOGGER.debug("[MotoGP Stand-in] 404 %s %s", path, query)
+                return web.Response(status=404)
+            if replay is not None:
+                data = replay.rewrite(path, query, data)
+
+        body = json.dumps(data, ensure_ascii=False).encode()
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def handle_status(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "fixtures": self._root,
+            "hits":     dict(sorted(self._hits.items())),
+            "replay":   self._replay.status() if self._replay else None,
+        })
+
+    async def handle_restart(self, request: web.Request) -> web.Response:
+        if self._replay is None:
+            return web.Response(status=404)
+        self._replay.restart(self._lead)
+        _LOGGER.info("[MotoGP Stand-in] Rejeu relance, depart %s", self._replay.anchor.isoformat())
+        return web.json_response(self._replay.status())
+
+class Recorder:
+
+    def __init__(self, session: aiohttp.ClientSession, upstream: str, root: str) -> None:
+        self._session  = session
+        self._upstream = upstream.rstrip("/")
+        self._root     = root
+
+    async def get(self, endpoint: str, save: bool = True) -> Any:
+        async with self._session.get(f"{self._upstream}/{endpoint}") as resp:
+            if resp.status == 404:
+                _LOGGER.warning("[MotoGP Stand-in] 404 %s", endpoint)
+                return None
+            resp.raise_for_status()
+            data = await resp.json(content_type=None)
+        if save:
+            path, query = split_endpoint(endpoint)
+            target = fixture_path(self._root, path, query)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, ensure_ascii=False, indent=1)
+            _LOGGER.info("[MotoGP Stand-in] Enregistre %s", endpoint)
+        return data
+
+async def record(args: argparse.Namespace) -> None:
+    async with aiohttp.ClientSession() as session:
+        rec = Recorder(session, args.upstream, args.fixtures)
+
+        seasons = await rec.get("results/seasons") or []
+        season  = next(
+            (
+                s for s in seasons
+                if (str(s.get("year")) == args.season if args.season else s.get("current") is True)
+            ),
+            None,
+        )
+        if season is None:
+            raise SystemExit(f"Saison {args.season or 'courante'} introuvable")
+        season_id = season["id"]
+
+        categories = await rec.get(f"results/categories?seasonUuid={season_id}") or []
+        category   = next((c for c in categories if c.get("name") == CATEGORY_NAME), None)
+        if category is None:
+            raise SystemExit(f"Categorie {CATEGORY_NAME} introuvable")
+        category_id = category["id"]
+
+        standings = await rec.get(f"results/standings?seasonUuid={season_id}&categoryUuid={category_id}") or {}
+        events    = await rec.get(f"results/events?seasonUuid={season_id}") or []
+
+        rows = (standings.get("classification") or []) if isinstance(standings, dict) else standings
+        for uuid in {(r.get("rider") or {}).get("riders_api_uuid") for r in rows} - {None, ""}:
+            await rec.get(f"riders/{uuid}")
+
+        now    = datetime.now(timezone.utc)
+        events = sorted(events, key=lambda e: e.get("date_start") or "")
+        chosen = [
+            e for e in events
+            if not e.get("test", False)
+            and (
+                args.event in (str(e.get("id")), e.get("name"))
+                if args.event
+                else (end := parse_iso(e.get("date_end"))) is not None and end < now
+            )
+        ]
+        for event in chosen if args.event or args.all_events else chosen[-1:]:
+            sessions = await rec.get(
+                f"results/sessions?eventUuid={event['id']}&categoryUuid={category_id}"
+            ) or []
+            for s in sessions:
+                await rec.get(f"results/session/{s['id']}/classification?test=false")
+
+async def record_live(args: argparse.Namespace) -> None:
+    endpoint = f"{LIVE_ENDPOINT}?sessionUuid={args.session}"
+    started: float | None = None
+    last:    bytes | None = None
+    frames = 0
+
+    async with aiohttp.ClientSession() as session:
+        rec = Recorder(session, args.upstream, args.fixtures)
+        with open(args.out, "w", encoding="utf-8") as fh:
+            try:
+                while True:
+                    data = await rec.get(endpoint, save=False)
+                    if data is not None:
+                        if started is None:
+                            started = time.monotonic()
+                            fh.write(json.dumps({
+                                "session_uuid": args.session,
+                                "event_uuid":   args.event,
+                                "session_date": datetime.now(timezone.utc).isoformat(),
+                            }) + "\n")
+                        body = json.dumps(data, ensure_ascii=False, sort_keys=True).encode()
+                        if body != last:
+                            last    = body
+                            frames += 1
+                            fh.write(json.dumps(
+                                {"t": round(time.monotonic() - started, 1), "body": data},
+                                ensure_ascii=False,
+                            ) + "\n")
+                            fh.flush()
+                        status = ((data.get("head") or {}).get("session_status_name") or "").lower()
+                        if status in ("finished", "f") and not args.keep_going:
+                            break
+                    await asyncio.sleep(args.interval)
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                pass
+    _LOGGER.info("[MotoGP Stand-in] %d trames enregistrees dans %s", frames, args.out)
+
+def serve(args: argparse.Namespace) -> None:
+    standin = StandIn(args)
+    _LOGGER.info("[MotoGP Stand-in] BASE_URL = http://%s:%d%s", args.host, args.port, API_PREFIX)
+    web.run_app(standin.app(), host=args.host, port=args.port, print=None)
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Offline Pulselive stand-in for the MotoGP Tracker integration")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="fixture directory")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="serve fixtures, optionally replaying a live session")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--replay", help="JSON lines live timing recording to play back")
+    p.add_argument("--speed", type=float, default=10.0, help="replay time compression factor")
+    p.add_argument("--step", action="store_true", help="advance one recorded frame per live poll")
+    p.add_argument("--lead", type=float, default=60.0, help="seconds before the replayed session starts")
+    p.add_argument("--latency", type=float, default=0.0, help="added response latency in ms")
+    p.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+
+    p = sub.add_parser("record", help="record static fixtures from the live API")
+    p.add_argument("--upstream", default=UPSTREAM_URL)
+    p.add_argument("--season", help="season year (default: current)")
+    p.add_argument("--event", help="event uuid or name (default: last finished event)")
+    p.add_argument("--all-events", action="store_true", help="record sessions of every finished event")
+
+    p = sub.add_parser("record-live", help="record a live timing session as a replay file")
+    p.add_argument("--upstream", default=UPSTREAM_URL)
+    p.add_argument("--session", required=True, help="session uuid")
+    p.add_argument("--event", required=True, help="event uuid")
+    p.add_argument("--out", required=True)
+    p.add_argument("--interval", type=float, default=5.0)
+    p.add_argument("--keep-going", action="store_true", help="do not stop when the session finishes")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        stream=sys.stderr,
+    )
+    if args.command == "serve":
+        serve(args)
+    elif args.command == "record":
+        asyncio.run(record(args))
+    else:
+        asyncio.run(record_live(args))
+
+if __name__ == "__main__":
+    main()
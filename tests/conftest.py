@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.motogp_tracker.models import LiveRow
+
+def _live_row(
+    pos: int | None = 1,
+    number: str = "93",
+    laps: int | None = 1,
+    last_lap: str = "",
+    gap_first: str = "",
+    status: str = "CL",
+) -> LiveRow:
+    return LiveRow(
+        pos=pos, number=number, name=f"Rider {number}", nation="", team="", bike="",
+        laps=laps, gap_first=gap_first, last_lap=last_lap, status=status,
+    )
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    yield
+
+@pytest.fixture
+def live_row():
+    return _live_row
+
+@pytest.fixture
+def config_dir(hass, tmp_path):
+    (tmp_path / ".storage").mkdir()
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
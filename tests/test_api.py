@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.motogp_tracker.api import MotoGPApiClient
+from custom_components.motogp_tracker.resilience import BREAKER_CLOSED
+
+class _Response:
+
+    content_type = "application/json"
+
+    def __init__(self, status: int, body: bytes = b"", etag: str | None = None) -> None:
+        self.status  = status
+        self.headers = {"ETag": etag} if etag else {}
+        self._body   = body
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def release(self) -> None:
+        pass
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+async def test_shared_fetch_survives_leader_cancellation(hass: HomeAssistant) -> None:
+    client  = MotoGPApiClient(hass)
+    release = asyncio.Event()
+    calls   = 0
+
+    async def _request(endpoint: str, timeout: int) -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"endpoint": endpoint}
+
+    with patch.object(client, "_request", _request):
+        leader   = asyncio.create_task(client.fetch("results/seasons"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.fetch("results/seasons"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        assert await follower == {"endpoint": "results/seasons"}
+        assert calls == 1
+        try:
+            await leader
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("leader should be cancelled")
+
+    await client.async_close()
+
+async def test_not_modified_without_cache_entry_refetches(hass: HomeAssistant) -> None:
+    client   = MotoGPApiClient(hass)
+    endpoint = "results/seasons"
+    body     = json.dumps([{"id": "s1", "year": 2025}]).encode()
+    await client._cache.async_load()
+    client._cache.put(endpoint, [], 2, '"v1"', None)
+
+    sent: list[dict] = []
+
+    def _get(url: str, headers: dict, timeout) -> _Response:
+        sent.append(headers)
+        if len(sent) == 1:
+            client._cache.discard(endpoint)
+            return _Response(304)
+        return _Response(200, body, '"v2"')
+
+    session = MagicMock()
+    session.get.side_effect = _get
+    with patch.object(client, "_get_session", return_value=session):
+        assert await client.fetch(endpoint) == [{"id": "s1", "year": 2025}]
+
+    assert sent == [{"If-None-Match": '"v1"'}, {}]
+    assert client.api_status == "ok"
+    assert all(b.state == BREAKER_CLOSED for b in client._breakers.values())
+    await client.async_close()
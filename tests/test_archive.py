@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.motogp_tracker import QUERY_ARCHIVE_SCHEMA, SYNC_ARCHIVE_SCHEMA
+from custom_components.motogp_tracker.archive import ResultsArchive
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts", "fixtures", "pulselive")
+
+class _FixtureClient:
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def storage_key(self, key: str) -> str:
+        return key
+
+    async def fetch(self, endpoint: str):
+        self.calls.append(endpoint)
+        await asyncio.sleep(0)
+        path, _, query = endpoint.partition("?")
+        name  = "&".join(sorted(query.split("&"))) if query else "_"
+        parts = path.strip("/").split("/")
+        for candidate in (os.path.join(FIXTURES, *parts, f"{name}.json"), os.path.join(FIXTURES, *parts, "_.json")):
+            if os.path.exists(candidate):
+                with open(candidate, encoding="utf-8") as fh:
+                    return json.load(fh)
+        return None
+
+async def test_concurrent_syncs_share_one_run(hass: HomeAssistant, config_dir) -> None:
+    client  = _FixtureClient()
+    archive = ResultsArchive(hass, client)
+    try:
+        first, second = await asyncio.gather(archive.async_sync(), archive.async_sync())
+        assert first == second
+        assert first["sessions"] > 0 and first["rows"] > 0
+        assert client.calls.count("results/seasons") == 1
+
+        rows = await archive.async_query(rider="93", session_type="RAC")
+        assert rows and all(row["rider_number"] == "93" for row in rows)
+    finally:
+        await archive.async_close()
+
+async def test_sync_waits_for_other_season(hass: HomeAssistant, config_dir) -> None:
+    client  = _FixtureClient()
+    archive = ResultsArchive(hass, client)
+    try:
+        current, other = await asyncio.gather(archive.async_sync(), archive.async_sync(1949))
+        assert current["sessions"] > 0
+        assert other == {"events": 0, "sessions": 0, "rows": 0}
+        assert client.calls.count("results/seasons") == 2
+    finally:
+        await archive.async_close()
+
+async def test_events_without_sessions_are_retried(hass: HomeAssistant, config_dir) -> None:
+    client  = _FixtureClient()
+    archive = ResultsArchive(hass, client)
+    try:
+        first = await archive.async_sync()
+        assert first["events"] == 1 and first["rows"] > 0
+
+        client.calls.clear()
+        second = await archive.async_sync()
+        assert second == {"events": 0, "sessions": 0, "rows": 0}
+        retried = [c for c in client.calls if c.startswith("results/sessions?")]
+        assert len(retried) == 4 and not any("8b8dca5d" in c for c in retried)
+    finally:
+        await archive.async_close()
+
+def test_query_schema_coerces_and_bounds() -> None:
+    data = QUERY_ARCHIVE_SCHEMA({"rider": 93, "season_year": "2025", "session_type": "rac"})
+    assert data == {"rider": "93", "season_year": 2025, "session_type": "RAC", "limit": 200}
+
+    for bad in ({"limit": "abc"}, {"limit": 0}, {"limit": 100000}, {"season_year": "x"}, {"session_type": "WUP"}):
+        with pytest.raises(vol.Invalid):
+            QUERY_ARCHIVE_SCHEMA(bad)
+    with pytest.raises(vol.Invalid):
+        SYNC_ARCHIVE_SCHEMA({"season_year": "next"})
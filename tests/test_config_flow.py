@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.motogp_tracker.const import (
+    CONF_ATTRIBUTE_MAX_ROWS,
+    CONF_RIDER_ENTITIES,
+    DOMAIN,
+)
+from custom_components.motogp_tracker.config_flow import MotoGPOptionsFlow
+
+async def test_options_flow(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={CONF_ATTRIBUTE_MAX_ROWS: 5})
+    entry.add_to_hass(hass)
+
+    flow = MotoGPOptionsFlow(entry)
+    flow.hass = hass
+    result = await flow.async_step_init()
+    assert result["type"] is FlowResultType.FORM
+    assert result["data_schema"]({})[CONF_ATTRIBUTE_MAX_ROWS] == 5
+
+    result = await flow.async_step_init({CONF_ATTRIBUTE_MAX_ROWS: 10, CONF_RIDER_ENTITIES: True})
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"] == {CONF_ATTRIBUTE_MAX_ROWS: 10, CONF_RIDER_ENTITIES: True}
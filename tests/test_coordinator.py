@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.motogp_tracker.api import MotoGPApiClient
+from custom_components.motogp_tracker.coordinator import (
+    MotoGPEventCoordinator,
+    MotoGPLiveTimingCoordinator,
+    MotoGPStandingsCoordinator,
+)
+from custom_components.motogp_tracker.models import SessionRow
+from custom_components.motogp_tracker.resilience import CircuitOpenError
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts", "fixtures")
+SEASON   = "d310787c-57bc-5d81-bd8f-be81aa981858"
+CATEGORY = "d7234230-f579-50cb-8358-264fa331f6e7"
+EVENT    = "8b8dca5d-bd0e-5659-b89a-0baa8aa919a7"
+RACE     = "6ccfc192-ccb7-5521-8a03-4fefeb26bbd4"
+
+STANDINGS = f"results/standings?seasonUuid={SEASON}&categoryUuid={CATEGORY}"
+EVENTS    = f"results/events?seasonUuid={SEASON}"
+SESSIONS  = f"results/sessions?eventUuid={EVENT}&categoryUuid={CATEGORY}"
+LIVE      = f"timing-gateway/livetiming-lite?sessionUuid={RACE}"
+
+def _fixture(*parts: str) -> Any:
+    with open(os.path.join(FIXTURES, "pulselive", *parts), encoding="utf-8") as fh:
+        return json.load(fh)
+
+def _client(hass: HomeAssistant, responses: dict[str, Any]) -> MotoGPApiClient:
+    client = MotoGPApiClient(hass)
+
+    async def fetch(endpoint: str, timeout: int = 20) -> Any:
+        value = responses.get(endpoint)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    client.fetch = fetch
+    return client
+
+def _config() -> MagicMock:
+    config = MagicMock()
+    config.data = {"season_id": SEASON, "category_id": CATEGORY, "season_year": 2025}
+    return config
+
+async def test_standings_recover_after_404_with_same_body(hass: HomeAssistant) -> None:
+    body      = _fixture("results", "standings", f"categoryUuid={CATEGORY}&seasonUuid={SEASON}.json")
+    responses = {STANDINGS: body}
+    client    = _client(hass, responses)
+    coord     = MotoGPStandingsCoordinator(hass, client, _config())
+
+    await coord.async_refresh()
+    assert coord.data["riders"]
+
+    responses[STANDINGS] = None
+    await coord.async_refresh()
+    assert coord.data["riders"] == ()
+
+    responses[STANDINGS] = body
+    await coord.async_refresh()
+    assert coord.data["riders"]
+    await coord.async_shutdown()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await client.async_close()
+
+@pytest.mark.freeze_time("2025-06-21T09:00:00+00:00")
+async def test_sessions_recover_after_404_with_same_body(hass: HomeAssistant) -> None:
+    body      = _fixture("results", "sessions", f"categoryUuid={CATEGORY}&eventUuid={EVENT}.json")
+    responses = {EVENTS: _fixture("results", "events", f"seasonUuid={SEASON}.json"), SESSIONS: body}
+    client    = _client(hass, responses)
+    coord     = MotoGPEventCoordinator(hass, client, _config())
+
+    await coord.async_refresh()
+    assert coord.data["race_uuid"] == RACE
+
+    responses[SESSIONS] = None
+    await coord.async_refresh()
+    assert coord.data["sessions"] == ()
+
+    responses[SESSIONS] = body
+    await coord.async_refresh()
+    assert coord.data["sessions"] and coord.data["race_uuid"] == RACE
+    await coord.async_shutdown()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await client.async_close()
+
+@pytest.mark.freeze_time("2025-06-21T09:00:00+00:00")
+@pytest.mark.parametrize("error", [CircuitOpenError("results/sessions", 30.0), TimeoutError()])
+async def test_sessions_kept_when_fetch_fails(hass: HomeAssistant, error: Exception) -> None:
+    responses = {
+        EVENTS:   _fixture("results", "events", f"seasonUuid={SEASON}.json"),
+        SESSIONS: _fixture("results", "sessions", f"categoryUuid={CATEGORY}&eventUuid={EVENT}.json"),
+    }
+    client = _client(hass, responses)
+    coord  = MotoGPEventCoordinator(hass, client, _config())
+
+    await coord.async_refresh()
+    sessions = coord.data["sessions"]
+
+    responses[SESSIONS] = error
+    await coord.async_refresh()
+    assert coord.last_update_success
+    assert coord.data["sessions"] == sessions and coord.data["race_uuid"] == RACE
+    await coord.async_shutdown()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await client.async_close()
+
+@pytest.mark.freeze_time("2025-06-22T12:10:00+00:00")
+async def test_live_recovers_after_404_with_same_body(hass: HomeAssistant) -> None:
+    with open(os.path.join(FIXTURES, "replays", "mugello-2025-rac.jsonl"), encoding="utf-8") as fh:
+        body = json.loads(fh.readlines()[10])["body"]
+    event = MagicMock()
+    event.data = {"sessions": (
+        SessionRow(id=RACE, type="RAC", start_utc="2025-06-22T12:00:00+00:00", start_local="", status=""),
+    )}
+    responses = {LIVE: body}
+    client    = _client(hass, responses)
+    coord     = MotoGPLiveTimingCoordinator(hass, client, event)
+
+    await coord.async_refresh()
+    assert coord.data["classification"]
+
+    responses[LIVE] = None
+    await coord.async_refresh()
+    assert coord.data["session_status"] == "waiting"
+
+    responses[LIVE] = body
+    await coord.async_refresh()
+    assert coord.data["classification"]
+    await coord.async_shutdown()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await client.async_close()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.motogp_tracker.const import STORAGE_KEY_HTTP_CACHE, STORAGE_VERSION
+from custom_components.motogp_tracker.decode import SCHEMA_VERSION, decode
+from custom_components.motogp_tracker.http_cache import ResponseCache
+
+def test_decode_keeps_read_top_level_keys() -> None:
+    body = b'{"head": {"num_laps": 8, "extra": 1}, "rider": {"93": {"pos": 1}}, "circuit": {"name": "x"}}'
+    assert decode("timing-gateway/livetiming-lite?sessionUuid=s1", body) == {
+        "head": {"num_laps": 8, "extra": 1}, "rider": {"93": {"pos": 1}},
+    }
+
+def test_decode_leaves_lists_untouched() -> None:
+    body = b'[{"id": "s1", "year": 2025, "current": true, "name": null}]'
+    assert decode("results/seasons", body) == [{"id": "s1", "year": 2025, "current": True, "name": None}]
+
+async def test_cache_drops_entries_from_other_schema(hass: HomeAssistant, hass_storage) -> None:
+    entry = {"etag": '"a"', "last_modified": None, "stored_at": time.time(), "size": 10, "data": []}
+    hass_storage[STORAGE_KEY_HTTP_CACHE] = {
+        "version": STORAGE_VERSION,
+        "key":     STORAGE_KEY_HTTP_CACHE,
+        "data":    {"entries": {
+            "results/seasons":        {**entry, "schema": SCHEMA_VERSION},
+            "results/categories?x=1": {**entry, "schema": "stale"},
+            "results/events?x=1":     entry,
+        }},
+    }
+    cache = ResponseCache(hass)
+    await cache.async_load()
+    assert cache.get("results/seasons") is not None
+    assert cache.get("results/categories?x=1") is None
+    assert cache.get("results/events?x=1") is None
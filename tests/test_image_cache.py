@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.motogp_tracker.image_cache import ImageCache
+
+URL = "https://flagcdn.com/48x36/it.png"
+
+class _Response:
+
+    status       = 200
+    content_type = "image/png"
+
+    def __init__(self, body: bytes, gate: asyncio.Event) -> None:
+        self._gate   = gate
+        self.content = MagicMock()
+
+        async def _read(size: int) -> bytes:
+            await gate.wait()
+            return body
+
+        self.content.read = _read
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        pass
+
+async def test_local_url_does_not_wait_for_download(hass: HomeAssistant, config_dir) -> None:
+    gate    = asyncio.Event()
+    session = MagicMock()
+    session.get.return_value = _Response(b"\x89PNG fake", gate)
+    cache = ImageCache(hass, lambda: session)
+    await cache.async_load()
+
+    assert cache.local_url(URL) == URL
+    assert cache.local_url(URL) == URL
+    assert session.get.call_count <= 1
+
+    gate.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert session.get.call_count == 1
+    assert cache.local_url(URL).startswith("/api/motogp_tracker/image/")
+
+async def test_download_errors_are_contained(hass: HomeAssistant, config_dir) -> None:
+    session = MagicMock()
+    session.get.side_effect = TypeError("resolver")
+    cache = ImageCache(hass, lambda: session)
+
+    assert cache.local_url(URL) == URL
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert cache.local_url(URL) == URL
+    assert session.get.call_count == 1
+
+async def test_on_ready_runs_after_download(hass: HomeAssistant, config_dir) -> None:
+    gate    = asyncio.Event()
+    session = MagicMock()
+    session.get.return_value = _Response(b"\x89PNG fake", gate)
+    cache = ImageCache(hass, lambda: session)
+    await cache.async_load()
+    ready = MagicMock()
+
+    assert cache.local_url(URL, ready) == URL
+    assert cache.local_url(URL, ready) == URL
+    ready.assert_not_called()
+
+    gate.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    ready.assert_called_once_with()
+    assert cache.local_url(URL, ready).startswith("/api/motogp_tracker/image/")
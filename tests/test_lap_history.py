@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.motogp_tracker.lap_history import LapHistory
+
+TIMES = ["1'47.512", "1'46.904", "1'46.295", "1'46.610", "1'46.881", "1'47.020", "1'46.450"]
+
+def test_record_fixture_lap_times(live_row) -> None:
+    history = LapHistory()
+    for lap, time in enumerate(TIMES, start=1):
+        history.record(
+            (live_row(1, "93", lap, time), live_row(2, "63", lap, time, f"{lap * 0.5:.3f}")),
+            len(TIMES),
+        )
+        history.record((live_row(1, "93", lap, time),), len(TIMES))
+
+    leader = history.as_dict("93")["93"]
+    assert leader["laps"] == list(range(1, 8))
+    assert leader["lap_times"] == pytest.approx([107.512, 106.904, 106.295, 106.61, 106.881, 107.02, 106.45])
+    assert leader["best"] == 106.295
+    assert leader["best_lap"] == 3
+    assert leader["rolling_average"] == pytest.approx((106.295 + 106.61 + 106.881 + 107.02 + 106.45) / 5, abs=1e-3)
+    assert leader["gaps"] == [0.0] * 7
+
+    chaser = history.as_dict("63")["63"]
+    assert chaser["gaps"][-1] == 3.5
+    assert chaser["gap_trend"] == pytest.approx(0.5)
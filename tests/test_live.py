@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from functools import partial
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.motogp_tracker.api import MotoGPApiClient
+from custom_components.motogp_tracker.const import (
+    EVENT_LAP_COMPLETED,
+    EVENT_OVERTAKE,
+    EVENT_RETIREMENT,
+    EVENT_SESSION_STATUS,
+)
+from custom_components.motogp_tracker.coordinator import MotoGPLiveTimingCoordinator
+
+async def test_fire_events(hass: HomeAssistant, live_row) -> None:
+    event = MagicMock()
+    event.data = {}
+    coord = MotoGPLiveTimingCoordinator(hass, MotoGPApiClient(hass), event)
+
+    overtakes   = async_capture_events(hass, EVENT_OVERTAKE)
+    laps        = async_capture_events(hass, EVENT_LAP_COMPLETED)
+    retirements = async_capture_events(hass, EVENT_RETIREMENT)
+    statuses    = async_capture_events(hass, EVENT_SESSION_STATUS)
+
+    engine = coord._delta
+    _row   = partial(live_row, last_lap="1'46.295")
+    coord._fire_events("s1", "started", engine.update((_row(1, "93", 1), _row(2, "63", 1))))
+    coord._fire_events("s1", "started", engine.update((_row(1, "63", 2), _row(2, "93", 2))))
+    coord._fire_events("s1", "finished", engine.update((_row(1, "63", 3), _row(0, "93", 2, status="RET"))))
+    await hass.async_block_till_done()
+
+    assert [e.data["number"] for e in overtakes] == ["63"]
+    assert len(laps) == 3
+    assert [e.data["number"] for e in retirements] == ["93"]
+    assert [(e.data["from"], e.data["to"]) for e in statuses] == [("started", "finished")]
+    await coord.async_shutdown()
+    await coord.async_shutdown()
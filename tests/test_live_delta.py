@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.motogp_tracker.live_delta import LiveDeltaEngine, lap_seconds
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1'46.295", 106.295),
+        ("1:46.295", 106.295),
+        ("46.295", 46.295),
+        (106.5, 106.5),
+        ("", None),
+        (None, None),
+        ("--", None),
+    ],
+)
+def test_lap_seconds(value, expected) -> None:
+    if expected is None:
+        assert lap_seconds(value) is None
+    else:
+        assert lap_seconds(value) == pytest.approx(expected)
+
+def test_fastest_lap_with_apostrophe_times(live_row) -> None:
+    engine = LiveDeltaEngine()
+    engine.update((live_row(laps=1, last_lap="1'47.100"),))
+
+    delta = engine.update((live_row(laps=2, last_lap="1'46.295"),))
+    assert delta.fastest_lap == {
+        "number": "93", "name": "Rider 93", "lap": 2, "lap_time": "1'46.295", "seconds": 106.295,
+    }
+
+    assert engine.update((live_row(laps=3, last_lap="1'46.900"),)).fastest_lap is None
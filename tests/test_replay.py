@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+from functools import partial
+import importlib.util
+import os
+
+from aiohttp import web
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from custom_components.motogp_tracker import api
+from custom_components.motogp_tracker.const import (
+    COORD_EVENT,
+    COORD_LIVE,
+    DOMAIN,
+    ENV_BASE_URL,
+    EVENT_FASTEST_LAP,
+    EVENT_LAP_COMPLETED,
+    EVENT_OVERTAKE,
+    EVENT_RETIREMENT,
+    EVENT_SESSION_STATUS,
+    KEY_CLIENT,
+    KEY_COORDINATORS,
+)
+from custom_components.motogp_tracker.resilience import TokenBucket
+
+ROOT    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STANDIN = os.path.join(ROOT, "scripts", "pulselive_standin.py")
+REPLAY  = os.path.join(ROOT, "scripts", "fixtures", "replays", "mugello-2025-rac.jsonl")
+EVENTS  = (EVENT_OVERTAKE, EVENT_LAP_COMPLETED, EVENT_FASTEST_LAP, EVENT_RETIREMENT, EVENT_SESSION_STATUS)
+
+def _load_standin():
+    spec   = importlib.util.spec_from_file_location("pulselive_standin", STANDIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+async def standin(hass: HomeAssistant, socket_enabled, config_dir, monkeypatch):
+    module = _load_standin()
+    app    = module.StandIn(argparse.Namespace(
+        fixtures=module.FIXTURES_DIR, replay=REPLAY, speed=1.0, step=True, lead=0.0, latency=0.0, error_rate=0.0,
+    )).app()
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    monkeypatch.setattr(api, "API_MICROCACHE_WINDOW", 0)
+    monkeypatch.setattr(api, "TokenBucket", partial(TokenBucket, 1000.0, 1000.0))
+    monkeypatch.setenv(ENV_BASE_URL, f"http://127.0.0.1:{port}{module.API_PREFIX}")
+    yield
+    await runner.cleanup()
+
+async def test_replayed_race(hass: HomeAssistant, standin) -> None:
+    fired: dict[str, list[dict]] = {name: [] for name in EVENTS}
+    for name in EVENTS:
+        hass.bus.async_listen(name, lambda event: fired[event.event_type].append(event.data))
+
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coords = hass.data[DOMAIN][entry.entry_id][KEY_COORDINATORS]
+    live   = coords[COORD_LIVE]
+    states = []
+    for _ in range(70):
+        await live.async_refresh()
+        await hass.async_block_till_done()
+        states.append(hass.states.get("sensor.motogp_live_timing").state)
+
+    assert live.tracked_session == "6ccfc192-ccb7-5521-8a03-4fefeb26bbd4"
+    assert states[0] == "warm up lap" and states[-1] == "finished"
+    assert not live.data["active"]
+
+    state = hass.states.get("sensor.motogp_live_timing")
+    assert state.attributes["session_type"] == "RAC"
+    assert state.attributes["current_lap"] == state.attributes["total_laps"] == 8
+    assert state.attributes["classification"][0]["pos"] == 1
+
+    assert fired[EVENT_OVERTAKE]
+    assert len(fired[EVENT_LAP_COMPLETED]) > 8
+    assert fired[EVENT_FASTEST_LAP]
+    assert [e["number"] for e in fired[EVENT_RETIREMENT]] == ["5"]
+    assert [(e["from"], e["to"]) for e in fired[EVENT_SESSION_STATUS]] == [
+        ("warm up lap", "started"), ("started", "finished"),
+    ]
+
+    history = await hass.services.async_call(
+        DOMAIN, "get_lap_history", {"number": 93}, blocking=True, return_response=True
+    )
+    rider = history["riders"]["93"]
+    assert rider["laps"] == list(range(1, 9))
+    assert None not in rider["lap_times"] and None not in rider["gaps"]
+    assert rider["best"] == min(rider["lap_times"])
+
+    namespace = hass.data[DOMAIN][entry.entry_id][KEY_CLIENT].namespace
+    assert namespace
+    assert coords[COORD_EVENT]._snapshot.key == f"{DOMAIN}.snapshot_event.{namespace}"
+    assert coords[COORD_EVENT]._index_store.key == f"{DOMAIN}.season_index.{namespace}"
+    databases = [name for name in os.listdir(hass.config.path(".storage")) if name.endswith(".db")]
+    assert databases == [f"{DOMAIN}_archive.{namespace}.db"]
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert entry.state is ConfigEntryState.NOT_LOADED
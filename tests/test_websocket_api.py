@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.motogp_tracker.const import COORD_LIVE, DOMAIN, KEY_COORDINATORS
+from custom_components.motogp_tracker.coordinator import serialize
+from custom_components.motogp_tracker.live_delta import LiveDelta, LiveDeltaEngine
+from custom_components.motogp_tracker.models import LiveRow
+from custom_components.motogp_tracker.websocket_api import async_register_websocket_commands
+
+class _FakeLive:
+
+    _records = {"classification": LiveRow}
+
+    def __init__(self) -> None:
+        self.data: dict = {}
+        self.last_delta = LiveDelta()
+        self._engine    = LiveDeltaEngine()
+        self._listeners: list = []
+
+    def async_add_listener(self, update):
+        self._listeners.append(update)
+        return lambda: self._listeners.remove(update)
+
+    def as_jsonable(self) -> dict:
+        return serialize(self.data, self._records)
+
+    def push(self, session_uuid: str | None, rows: tuple[LiveRow, ...]) -> None:
+        self.data = {"session_uuid": session_uuid, "active": bool(rows), "classification": rows}
+        self.last_delta = self._engine.update(rows) if rows else LiveDelta()
+        for update in list(self._listeners):
+            update()
+
+async def test_live_subscription_snapshots_on_session_change(hass: HomeAssistant, hass_ws_client, live_row) -> None:
+    assert await async_setup_component(hass, "websocket_api", {})
+    coord = _FakeLive()
+    hass.data[DOMAIN] = {"entry": {KEY_COORDINATORS: {COORD_LIVE: coord}}}
+    async_register_websocket_commands(hass)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": f"{DOMAIN}/live/subscribe"})
+    assert (await client.receive_json())["success"]
+    assert (await client.receive_json())["event"]["type"] == "snapshot"
+
+    coord.push("s1", (live_row(1, "93", 1), live_row(2, "63", 1)))
+    assert (await client.receive_json())["event"]["type"] == "snapshot"
+
+    coord.push("s1", (live_row(1, "63", 2), live_row(2, "93", 2)))
+    event = (await client.receive_json())["event"]
+    assert event["type"] == "delta"
+    assert {r["number"] for r in event["changed"]} == {"63", "93"}
+
+    coord.push("s1", ())
+    event = (await client.receive_json())["event"]
+    assert event["type"] == "snapshot"
+    assert event["classification"] == []
+
+    coord.push("s2", (live_row(1, "5", 1),))
+    event = (await client.receive_json())["event"]
+    assert event["type"] == "snapshot"
+    assert [r["number"] for r in event["classification"]] == ["5"]